@@ -0,0 +1,266 @@
+# Imports
+import bisect
+import functools
+
+import numpy as np
+import scipy as sp
+
+import tables_172S as tb
+
+
+def _ascending_grid(
+    axes: tuple[np.ndarray, ...], values: np.ndarray
+) -> tuple[tuple[np.ndarray, ...], np.ndarray]:
+    """
+    Check that a table matches its axes and reorder both so every axis is ascending.
+
+    Args:
+        axes: One index array per table dimension, each strictly ascending or descending
+        values: Table values, indexed in the same order as axes
+
+    Returns:
+        Tuple of (axes, values) with every axis sorted ascending
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim < len(axes):
+        raise ValueError(
+            f"Table has {values.ndim} dimensions but {len(axes)} axes were given"
+        )
+
+    sorted_axes = []
+    for dimension, axis in enumerate(axes):
+        axis = np.asarray(axis, dtype=float)
+        if axis.ndim != 1 or len(axis) < 2:
+            raise ValueError(f"Axis {dimension} must be 1D with at least two points")
+        if len(axis) != values.shape[dimension]:
+            raise ValueError(
+                f"Axis {dimension} has {len(axis)} points but the table has "
+                f"{values.shape[dimension]} values in that dimension"
+            )
+
+        steps = np.diff(axis)
+        if np.all(steps < 0):
+            axis = axis[::-1]
+            values = np.flip(values, axis=dimension)
+        elif not np.all(steps > 0):
+            raise ValueError(f"Axis {dimension} must be strictly monotonic")
+        sorted_axes.append(axis)
+
+    return tuple(sorted_axes), values
+
+
+def build_grid_interpolator(
+    axes: tuple[np.ndarray, ...], values: np.ndarray
+) -> sp.interpolate.RegularGridInterpolator:
+    """
+    Build a linear interpolator over a table with checked, ascending axes.
+
+    Points outside the table raise ValueError, matching scipy.interpolate.interpn.
+    """
+    axes, values = _ascending_grid(axes, values)
+    return sp.interpolate.RegularGridInterpolator(axes, values)
+
+
+def _build_curve(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort a 1D table ascending in x so it can be passed straight to np.interp.
+
+    Returns:
+        Tuple of (xp, fp) arrays
+    """
+    (x,), y = _ascending_grid((x,), y)
+    return x, y
+
+
+@functools.cache
+def _extrapolating(
+    interpolator: sp.interpolate.RegularGridInterpolator,
+) -> sp.interpolate.RegularGridInterpolator:
+    """
+    Build (once per table) a copy of an interpolator that extends its edge cells linearly.
+    """
+    return sp.interpolate.RegularGridInterpolator(
+        interpolator.grid, interpolator.values, bounds_error=False, fill_value=None
+    )
+
+
+def interpolate_within_envelope(
+    interpolator: sp.interpolate.RegularGridInterpolator,
+    points: np.ndarray,
+    extrapolation: str = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Interpolate many points without raising for the ones outside the table.
+
+    Args:
+        interpolator: Interpolator from this module
+        points: Points to interpolate, shape (..., dimensions)
+        extrapolation: What to return for points outside the table
+            - None: NaN
+            - "clamp": the value at the nearest table edge
+            - "linear": the edge cell extended linearly
+            Points with a NaN coordinate always return NaN.
+
+    Returns:
+        Tuple of (values, status). Status is an integer array of shape points.shape[:-1]
+        with bit d set where coordinate d is outside the table or not a number, so 0
+        means the point was interpolated inside the table.
+    """
+    if extrapolation not in (None, "clamp", "linear"):
+        raise ValueError(f"Unknown extrapolation policy {extrapolation!r}")
+
+    points = np.asarray(points, dtype=float)
+    lower = np.array([axis[0] for axis in interpolator.grid])
+    upper = np.array([axis[-1] for axis in interpolator.grid])
+
+    outside = ~((points >= lower) & (points <= upper))
+    status = np.sum(outside << np.arange(points.shape[-1]), axis=-1)
+    is_nan = np.any(np.isnan(points), axis=-1)
+
+    flat_points = np.where(np.isnan(points), lower, points).reshape(-1, len(lower))
+    if extrapolation == "linear":
+        values = _extrapolating(interpolator)(flat_points)
+    else:
+        values = interpolator(np.clip(flat_points, lower, upper))
+    values = values.reshape(points.shape[:-1] + values.shape[1:])
+
+    invalid = is_nan if extrapolation else status != 0
+    values[invalid] = np.nan
+
+    return values, status
+
+
+class TrilinearKernel:
+    """
+    Scipy-free trilinear interpolation of single points over a 3D table.
+
+    Axis spacings are precomputed, so a lookup is a direct cell index on evenly spaced
+    axes (a bisection otherwise) followed by a blend of the eight surrounding values.
+    Results match scipy.interpolate.interpn, including ValueError for points outside
+    the table. Trailing table dimensions are treated as channels and blended together.
+    """
+
+    def __init__(self, axes: tuple[np.ndarray, ...], values: np.ndarray):
+        if len(axes) != 3:
+            raise ValueError(f"Trilinear kernel needs 3 axes, got {len(axes)}")
+
+        self.grid, self.values = _ascending_grid(axes, values)
+        self._axes = [axis.tolist() for axis in self.grid]
+        self._inverse_steps = [(1 / np.diff(axis)).tolist() for axis in self.grid]
+        self._spacings = []
+        for axis in self.grid:
+            steps = np.diff(axis)
+            is_even = np.allclose(steps, steps[0])
+            self._spacings.append(float(steps[0]) if is_even else None)
+
+    def _locate(self, dimension: int, x: float) -> tuple[int, float]:
+        """
+        Find the lower cell index and fractional position of x along one axis.
+        """
+        axis = self._axes[dimension]
+        if not axis[0] <= x <= axis[-1]:
+            raise ValueError(
+                f"One of the requested xi is out of bounds in dimension {dimension}"
+            )
+
+        spacing = self._spacings[dimension]
+        if spacing is not None:
+            index = int((x - axis[0]) / spacing)
+        else:
+            index = bisect.bisect_right(axis, x) - 1
+        index = min(index, len(axis) - 2)
+
+        return index, (x - axis[index]) * self._inverse_steps[dimension][index]
+
+    def __call__(self, x: float, y: float, z: float) -> np.ndarray:
+        """
+        Interpolate the table at one point.
+
+        Returns:
+            0D array for a plain table, or a 1D array with one value per channel
+        """
+        i, tx = self._locate(0, x)
+        j, ty = self._locate(1, y)
+        k, tz = self._locate(2, z)
+
+        corners = self.values[i : i + 2, j : j + 2, k : k + 2]
+        edges = corners[0] + tx * (corners[1] - corners[0])
+        faces = edges[0] + ty * (edges[1] - edges[0])
+        return faces[0] + tz * (faces[1] - faces[0])
+
+
+# Short field takeoff, interpolated over (weight, temperature, pressure altitude)
+sfto_ground_roll = build_grid_interpolator(
+    (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index),
+    tb.sfto_ground_roll,
+)
+sfto_dist_50_feet = build_grid_interpolator(
+    (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index),
+    tb.sfto_dist_50_feet,
+)
+
+# Short field takeoff speeds as (weight, speed) curves for np.interp
+lift_off_speed = _build_curve(tb.weight_index, tb.lift_off_index)
+speed_at_50_feet = _build_curve(tb.weight_index, tb.speed_at_50_feet_index)
+
+# Short field takeoff channels (ground roll, distance at 50 ft, lift off speed, speed
+# at 50 ft) stacked on one grid so a single lookup finds the cell and weights for all
+# four. The speeds depend on weight only, so they are broadcast across the other axes.
+sfto_performance = build_grid_interpolator(
+    (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index),
+    np.stack(
+        np.broadcast_arrays(
+            tb.sfto_ground_roll,
+            tb.sfto_dist_50_feet,
+            tb.lift_off_index[:, np.newaxis, np.newaxis],
+            tb.speed_at_50_feet_index[:, np.newaxis, np.newaxis],
+        ),
+        axis=-1,
+    ),
+)
+
+# Single point kernels for the short field takeoff tables
+sfto_ground_roll_kernel = TrilinearKernel(
+    (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index),
+    tb.sfto_ground_roll,
+)
+sfto_dist_50_feet_kernel = TrilinearKernel(
+    (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index),
+    tb.sfto_dist_50_feet,
+)
+sfto_performance_kernel = TrilinearKernel(
+    sfto_performance.grid, sfto_performance.values
+)
+
+# Maximum rate of climb (ft/min), interpolated over (temperature, pressure altitude),
+# and the climb speed (KIAS) it is flown at as a (pressure altitude, speed) curve
+max_rate_of_climb = build_grid_interpolator(
+    (tb.temperature_roc_index, tb.pressure_altitude_roc_index), tb.max_rate_of_climb
+)
+climb_speed_roc = _build_curve(tb.pressure_altitude_roc_index, tb.climb_speed_roc_index)
+
+# Time (min), fuel (gal) and distance (NM) to climb from sea level, cumulative over
+# pressure altitude, as three channels of one curve
+climb_time_fuel_distance = build_grid_interpolator(
+    (tb.pressure_altitude_timefueldist_index,),
+    np.stack([tb.time_to_climb, tb.fuel_to_climb, tb.distance_to_climb], axis=-1),
+)
+
+# Cruise true airspeed and fuel flow stacked as two channels of one grid over
+# (pressure altitude, temperature, manifold pressure, rpm)
+cruise_performance = build_grid_interpolator(
+    (
+        tb.cruise_pressure_altitudes,
+        tb.cruise_temperatures,
+        tb.cruise_manifold_pressures,
+        tb.cruise_rpms,
+    ),
+    np.stack([tb.cruise_true_airspeed, tb.cruise_fuel_flow], axis=-1),
+)
+
+# Cruise without manifold pressure, true airspeed and fuel flow stacked as channels
+# over (pressure altitude, temperature, rpm)
+cruise_performance_no_mp = build_grid_interpolator(
+    (tb.cruise_pressure_altitudes, tb.cruise_temperatures, tb.cruise_rpms),
+    np.stack([tb.cruise_true_airspeed_no_mp, tb.cruise_fuel_flow_no_mp], axis=-1),
+)
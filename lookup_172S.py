@@ -0,0 +1,297 @@
+# Imports
+import math
+import os
+
+import numpy as np
+
+import performance_172S as pf
+
+# Dense short field takeoff lookup, covering the envelope of the takeoff tables.
+# Values are ground roll and distance at 50 ft (feet) for a paved runway in calm wind,
+# stored as float32 with shape (2, pressure altitudes, temperatures, weights).
+takeoff_lookup_path = os.path.join(os.path.dirname(__file__), "takeoff_lookup_172S.npy")
+takeoff_pressure_altitudes = np.arange(0, 8025, 25)
+takeoff_temperatures = np.arange(0, 41, 1)
+takeoff_weights = np.arange(2200, 2555, 5)
+takeoff_lookup_axes = (
+    takeoff_pressure_altitudes,
+    takeoff_temperatures,
+    takeoff_weights,
+)
+
+
+def build_takeoff_lookup(path: str = takeoff_lookup_path) -> None:
+    """
+    Evaluate the takeoff distances over the dense lookup grid and save them as a .npy file.
+
+    The file is written next to its final location and then moved into place, so apps
+    that already memory-map an older copy keep a consistent view.
+    """
+    pressure_altitude, temperature, weight = np.meshgrid(
+        *takeoff_lookup_axes, indexing="ij"
+    )
+    ground_roll, dist_50ft = pf.get_takeoff_distances_sfto(
+        pressure_altitude, weight, temperature, 0, 0, 0, False
+    )
+    lookup = np.stack([ground_roll, dist_50ft]).astype(np.float32)
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        np.save(file, lookup)
+    os.replace(temporary_path, path)
+
+
+def load_takeoff_lookup(path: str = takeoff_lookup_path) -> np.ndarray | None:
+    """
+    Memory-map the dense takeoff lookup built by build_takeoff_lookup.
+
+    Returns:
+        Read-only memory-mapped array, or None if the file has not been built
+    """
+    if not os.path.exists(path):
+        return None
+
+    # Plain array views of the map index faster than memmap objects
+    lookup = np.load(path, mmap_mode="r").view(np.ndarray)
+    expected_shape = (2,) + tuple(len(axis) for axis in takeoff_lookup_axes)
+    if lookup.shape != expected_shape:
+        raise ValueError(
+            f"Takeoff lookup at {path} has shape {lookup.shape}, expected "
+            f"{expected_shape}; rebuild it with build_takeoff_lookup"
+        )
+
+    return lookup
+
+
+def _upper_index(axis: np.ndarray, x: np.ndarray, dimension: int) -> np.ndarray:
+    """
+    Find the index of the nearest point at or above x on an evenly spaced axis.
+
+    Single points are handled with plain floats, which is much quicker than numpy.
+    """
+    start, end = float(axis[0]), float(axis[-1])
+    step = float(axis[1] - axis[0])
+    if x.ndim == 0:
+        x = float(x)
+        is_inside = start <= x <= end
+    else:
+        is_inside = np.all((x >= start) & (x <= end))
+
+    if not is_inside:
+        raise ValueError(
+            f"One of the requested xi is out of bounds in dimension {dimension}"
+        )
+
+    # The tolerance keeps points on the grid from rounding up to the next one
+    if isinstance(x, float):
+        return math.ceil((x - start) / step - 1e-9)
+    return np.ceil((x - start) / step - 1e-9).astype(np.intp)
+
+
+def lookup_short_field_takeoff_performance(
+    lookup: np.ndarray,
+    pressure_altitude: float,
+    weight: float,
+    temperature: float,
+    runway_heading: float,
+    wind_direction: float,
+    wind_speed: float,
+    is_grass: bool,
+) -> tuple[float, float, float, float]:
+    """
+    Read short field takeoff performance from the dense lookup without interpolating.
+
+    Takes the same arguments and returns the same values as
+    pf.get_short_field_takeoff_performance, with the lookup from load_takeoff_lookup
+    first. Takeoff distances grow with pressure altitude, temperature and weight, so
+    distances come from the next grid point up on every axis (25 ft, 1 degC and 5 lb
+    apart). They are never shorter than the interpolated values and at most about
+    2% longer.
+
+    Returns:
+        Tuple of (ground_roll, dist_50ft, lift_off_speed, speed_at_50ft) in feet and knots
+    """
+    i = _upper_index(takeoff_pressure_altitudes, np.asarray(pressure_altitude), 0)
+    j = _upper_index(takeoff_temperatures, np.asarray(temperature), 1)
+    k = _upper_index(takeoff_weights, np.asarray(weight), 2)
+    ground_roll, dist_50ft = lookup[:, i, j, k].astype(float)
+
+    wind_modifier = pf.get_wind_runway_modifier(
+        runway_heading, wind_speed, wind_direction
+    )
+    grass_modifier = pf.get_grass_runway_modifier(is_grass)
+    modifier = wind_modifier * grass_modifier
+
+    ground_roll = ground_roll * modifier
+    dist_50ft = dist_50ft * modifier
+    lift_off_speed = pf.get_lift_off_speed(weight)
+    speed_at_50ft = pf.get_speed_at_50ft(weight)
+
+    return ground_roll[()], dist_50ft[()], lift_off_speed[()], speed_at_50ft[()]
+
+
+# Dense cruise surface, covering the envelope of the cruise tables. Values are true
+# airspeed (knots) and fuel flow (GPH) as a trailing channel axis, stored as raw
+# float32: the manifold pressure block of shape (pressure altitudes, temperatures,
+# manifold pressures, rpms, 2), then the block without manifold pressure of shape
+# (pressure altitudes, temperatures, rpms, 2). Every table entry is a grid point, so
+# blending the surrounding grid points reproduces the table interpolation exactly.
+cruise_lookup_path = os.path.join(os.path.dirname(__file__), "cruise_lookup_172S.f32")
+cruise_pressure_altitudes = np.arange(2000, 12500, 500)
+cruise_temperatures = np.arange(5, 16, 1)
+cruise_manifold_pressures = np.linspace(20, 24, 9)
+cruise_rpms = np.arange(2200, 2525, 25)
+cruise_lookup_axes = (
+    cruise_pressure_altitudes,
+    cruise_temperatures,
+    cruise_manifold_pressures,
+    cruise_rpms,
+)
+cruise_lookup_axes_no_mp = (
+    cruise_pressure_altitudes,
+    cruise_temperatures,
+    cruise_rpms,
+)
+
+
+def _cruise_lookup_shapes() -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Shapes of the manifold pressure and no manifold pressure blocks of the cruise file.
+    """
+    shape = tuple(len(axis) for axis in cruise_lookup_axes) + (2,)
+    shape_no_mp = tuple(len(axis) for axis in cruise_lookup_axes_no_mp) + (2,)
+    return shape, shape_no_mp
+
+
+def build_cruise_lookup(path: str = cruise_lookup_path) -> None:
+    """
+    Evaluate cruise performance over the dense lookup grids and save them as raw float32.
+
+    The file is written next to its final location and then moved into place, so apps
+    that already memory-map an older copy keep a consistent view.
+    """
+    points = np.meshgrid(*cruise_lookup_axes, indexing="ij")
+    true_airspeed, fuel_flow, _ = pf.get_cruise_performance_with_mp(*points)
+    surface = np.stack([true_airspeed, fuel_flow], axis=-1)
+
+    points = np.meshgrid(*cruise_lookup_axes_no_mp, indexing="ij")
+    true_airspeed, fuel_flow, _ = pf.get_cruise_performance_no_mp(*points)
+    surface_no_mp = np.stack([true_airspeed, fuel_flow], axis=-1)
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as file:
+        surface.astype(np.float32).tofile(file)
+        surface_no_mp.astype(np.float32).tofile(file)
+    os.replace(temporary_path, path)
+
+
+def load_cruise_lookup(
+    path: str = cruise_lookup_path,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Memory-map the dense cruise surfaces built by build_cruise_lookup.
+
+    Returns:
+        Tuple of read-only (surface, surface_no_mp) arrays sharing one memory map, or
+        None if the file has not been built
+    """
+    if not os.path.exists(path):
+        return None
+
+    shape, shape_no_mp = _cruise_lookup_shapes()
+    size = np.prod(shape)
+    size_no_mp = np.prod(shape_no_mp)
+
+    lookup = np.memmap(path, dtype=np.float32, mode="r")
+    if lookup.size != size + size_no_mp:
+        raise ValueError(
+            f"Cruise lookup at {path} has {lookup.size} values, expected "
+            f"{size + size_no_mp}; rebuild it with build_cruise_lookup"
+        )
+
+    # Plain array views of the map index faster than memmap objects
+    lookup = lookup.view(np.ndarray)
+    surface = lookup[:size].reshape(shape)
+    surface_no_mp = lookup[size:].reshape(shape_no_mp)
+    return surface, surface_no_mp
+
+
+def _blend(
+    surface: np.ndarray, axes: tuple[np.ndarray, ...], coordinates: list[np.ndarray]
+) -> np.ndarray:
+    """
+    Multilinear blend of the grid points around each point on evenly spaced axes.
+
+    The 2**d grid points around every point are gathered in one indexing operation and
+    blended one axis at a time. Coordinates outside the grid are held at its edge, and
+    NaN coordinates give NaN.
+    """
+    coordinates = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in coordinates)
+    )
+    shape = coordinates[0].shape
+    dimensions = len(axes)
+    is_nan = np.zeros(shape, dtype=bool)
+
+    corner_indices = []
+    fractions = []
+    for dimension, (axis, x) in enumerate(zip(axes, coordinates)):
+        is_nan |= np.isnan(x)
+        # fmin and fmax also move NaN onto the grid; is_nan masks those points later
+        position = (x - axis[0]) / (axis[1] - axis[0])
+        position = np.fmax(np.fmin(position, len(axis) - 1), 0)
+        index = np.minimum(position.astype(np.intp), len(axis) - 2)
+
+        # Lower and upper grid index along this axis, on a leading corner axis
+        corner_shape = (1,) * dimension + (2,) + (1,) * (dimensions - dimension - 1)
+        corner_shape += (1,) * len(shape)
+        corner_indices.append(index + np.arange(2).reshape(corner_shape))
+        fractions.append((position - index)[..., np.newaxis])
+
+    # Gather the corners, shape (2,) * dimensions + shape + (channels,), and blend them
+    values = surface[tuple(corner_indices)]
+    for fraction in fractions:
+        values = values[0] + fraction * (values[1] - values[0])
+
+    return np.where(is_nan[..., np.newaxis], np.nan, values)
+
+
+def lookup_cruise_performance(
+    lookup: tuple[np.ndarray, np.ndarray],
+    pressure_altitude: float,
+    temperature: float,
+    rpm: float,
+    manifold_pressure: float = None,
+) -> tuple[float, float]:
+    """
+    Read cruise performance from the dense surfaces with a local blend.
+
+    Takes the lookup from load_cruise_lookup first, then the arguments of
+    pf.interpolate_cruise_data, which it matches, including holding conditions outside
+    the tables at the nearest table edge. Arguments may also be arrays.
+
+    Returns:
+        Tuple of (true_airspeed, fuel_flow) in knots and gallons per hour
+    """
+    surface, surface_no_mp = lookup
+    if manifold_pressure is not None:
+        performance = _blend(
+            surface,
+            cruise_lookup_axes,
+            [pressure_altitude, temperature, manifold_pressure, rpm],
+        )
+    else:
+        performance = _blend(
+            surface_no_mp,
+            cruise_lookup_axes_no_mp,
+            [pressure_altitude, temperature, rpm],
+        )
+
+    return performance[..., 0][()], performance[..., 1][()]
+
+
+if __name__ == "__main__":
+    build_takeoff_lookup()
+    print(f"Wrote {takeoff_lookup_path}")
+    build_cruise_lookup()
+    print(f"Wrote {cruise_lookup_path}")
@@ -1,5 +1,6 @@
 import streamlit as st
 
+import lookup_172S as lk
 import performance_172S as pf
 
 st.set_page_config(
@@ -7,6 +8,17 @@ st.set_page_config(
     page_icon="🛫",
 )
 
+
+@st.cache_resource
+def load_takeoff_lookup():
+    """
+    Memory-map the dense takeoff lookup once per process, or None if it is not built.
+    """
+    return lk.load_takeoff_lookup()
+
+
+takeoff_lookup = load_takeoff_lookup()
+
 st.title("Takeoff Performance")
 st.sidebar.header("Takeoff Performance")
 
@@ -54,36 +66,45 @@ with col2:
 pressure_altitude = pf.get_pressure_altitude(user_altimeter, user_elevation)
 st.info(f"Pressure altitude is {round(pressure_altitude)} feet.")
 
-# Create two columns for the buttons
-col1, col2 = st.columns(2)
+if st.button("Calculate Takeoff Performance", type="primary"):
+    takeoff_inputs = (
+        pressure_altitude,
+        user_weight,
+        user_temperature,
+        user_runway,
+        user_wind_direction,
+        user_wind_speed,
+        user_surface_is_grass,
+    )
 
-with col1:
-    if st.button("Calculate Ground Roll", type="primary"):
-        user_ground_roll = pf.get_ground_roll_sfto(
-            pressure_altitude,
-            user_weight,
-            user_temperature,
-            user_runway,
-            user_wind_direction,
-            user_wind_speed,
-            user_surface_is_grass,
+    # Use the precomputed lookup when it has been built, which is quicker and rounds
+    # distances up to the next grid point, otherwise interpolate
+    if takeoff_lookup is not None:
+        takeoff_performance = lk.lookup_short_field_takeoff_performance(
+            takeoff_lookup, *takeoff_inputs
         )
+    else:
+        takeoff_performance = pf.get_short_field_takeoff_performance(*takeoff_inputs)
+
+    (
+        user_ground_roll,
+        user_dist_50ft,
+        user_lift_off_speed,
+        user_speed_at_50ft,
+    ) = takeoff_performance
+
+    # Create two columns for the results
+    col1, col2 = st.columns(2)
+
+    with col1:
         st.success(
             f"Predicted ground roll of **{round(user_ground_roll)}** feet.")
+        st.info(f"Lift off at **{round(user_lift_off_speed)}** knots.")
 
-with col2:
-    if st.button("Calculate Distance to Clear 50 ft Obstacle", type="primary"):
-        user_dist_50ft = pf.get_dist_50ft_sfto(
-            pressure_altitude,
-            user_weight,
-            user_temperature,
-            user_runway,
-            user_wind_direction,
-            user_wind_speed,
-            user_surface_is_grass,
-        )
+    with col2:
         st.success(
             f"Predicted **{round(user_dist_50ft)}** feet to clear 50 ft obstacle.")
+        st.info(f"Speed at 50 ft of **{round(user_speed_at_50ft)}** knots.")
 
 # Information about calculations
 with st.expander("How are these calculations performed?"):
@@ -1,3 +1,5 @@
+import math
+
 import streamlit as st
 
 import performance_172S as pf
@@ -11,7 +13,7 @@ st.title("Climb Performance")
 st.sidebar.header("Climb Performance")
 
 # Create tabs for different climb calculations
-tab1, tab2 = st.tabs(["Climb Gradients", "Climb Performance (Coming Soon)"])
+tab1, tab2 = st.tabs(["Climb Gradients", "Time, Fuel & Distance"])
 
 with tab1:
     st.markdown("""
@@ -49,14 +51,26 @@ with tab1:
         
         st.subheader("Climb Rates")
         
-        # Climb rates
+        # Climb rates, either from the POH table or entered by hand
+        use_poh_climb_rate = st.checkbox(
+            "Use POH maximum rate of climb",
+            value=False,
+            help="Take the climb rate at each altitude from the POH maximum rate of climb table (2550 lb)"
+        )
+
         start_climb_rate = st.slider(
-            "Rate of climb at starting altitude (ft/min):", 100, 1000, 700, 10
+            "Rate of climb at starting altitude (ft/min):", 100, 1000, 700, 10,
+            disabled=use_poh_climb_rate
         )
         
         end_climb_rate = st.slider(
-            "Rate of climb at ending altitude (ft/min):", 50, 800, 500, 10
+            "Rate of climb at ending altitude (ft/min):", 50, 800, 500, 10,
+            disabled=use_poh_climb_rate
         )
+
+        if use_poh_climb_rate:
+            start_climb_rate = None
+            end_climb_rate = None
     
     with col2:
         st.subheader("Wind Conditions")
@@ -124,6 +138,12 @@ with tab1:
                 )
                 
                 # Display results
+                if math.isnan(min_gradient):
+                    st.warning(
+                        "The climb leaves the POH maximum rate of climb table "
+                        "(up to 12,000 ft pressure altitude, -20 to 40 °C), so its "
+                        "gradient cannot be calculated."
+                    )
                 st.success("Climb Gradient Calculations Complete!")
                 
                 # Create three columns for results
@@ -156,7 +176,63 @@ with tab1:
                 
             except Exception as e:
                 st.error(f"Calculation error: {str(e)}")
-    
+
+        # Best climb speeds for these conditions
+        if st.button("Find Best Climb Speeds"):
+            try:
+                conditions = (
+                    start_altitude,
+                    end_altitude,
+                    start_climb_rate,
+                    end_climb_rate,
+                    start_temp,
+                    end_temp,
+                    start_wind_dir,
+                    start_wind_speed,
+                    end_wind_dir,
+                    end_wind_speed,
+                    start_heading,
+                    end_heading,
+                    altimeter_setting
+                )
+                best_angle_speed, airspeeds, gradients, times = pf.optimize_climb_airspeed(
+                    *conditions, objective="gradient"
+                )
+                best_rate_speed, _, _, _ = pf.optimize_climb_airspeed(
+                    *conditions, objective="time"
+                )
+
+                if math.isnan(best_angle_speed):
+                    st.warning(
+                        "The climb leaves the POH maximum rate of climb table, so "
+                        "the best climb speeds cannot be calculated."
+                    )
+
+                speed_col1, speed_col2 = st.columns(2)
+
+                with speed_col1:
+                    st.metric(
+                        "Steepest Climb Speed",
+                        f"{best_angle_speed:.1f} KIAS",
+                        help="Indicated airspeed giving the highest climb gradient over the ground"
+                    )
+
+                with speed_col2:
+                    st.metric(
+                        "Quickest Climb Speed",
+                        f"{best_rate_speed:.1f} KIAS",
+                        help="Indicated airspeed giving the shortest time to altitude"
+                    )
+
+                st.line_chart(
+                    {"Indicated airspeed (knots)": airspeeds, "Climb gradient (ft/nm)": gradients},
+                    x="Indicated airspeed (knots)",
+                    y="Climb gradient (ft/nm)"
+                )
+
+            except Exception as e:
+                st.error(f"Calculation error: {str(e)}")
+
     # Information about calculations
     with st.expander("How are these calculations performed?"):
         st.markdown("""
@@ -164,7 +240,8 @@ with tab1:
         
         This calculator performs the following steps:
         
-        1. **Interpolates** all parameters (climb rate, temperature, wind, heading) between starting and ending altitudes
+        1. **Interpolates** all parameters (climb rate, temperature, wind, heading) between starting and ending altitudes,
+           or reads the climb rate from the POH maximum rate of climb table when selected
         2. **Samples** the climb at 500-foot intervals to account for changing conditions
         3. **Calculates** true airspeed from indicated airspeed using:
            - Pressure altitude (from altimeter setting and true altitude)
@@ -183,21 +260,68 @@ with tab1:
 
 with tab2:
     st.markdown("""
-    ## Additional Climb Performance Calculator
+    ## Time, Fuel and Distance to Climb
     
-    This section will include additional climb performance calculations such as:
+    Calculate the time, fuel and distance needed to climb between two altitudes
+    using the Cessna 172S time, fuel and distance to climb table.
+    """)
     
-    * Time to climb to desired altitude
-    * Fuel consumption during climb  
-    * Distance traveled during climb
-    * Best rate of climb (Vy) speeds at various altitudes
-    * Best angle of climb (Vx) speeds
+    tfd_col1, tfd_col2 = st.columns(2)
     
-    ### Stay tuned for updates!
-    """)
+    with tfd_col1:
+        tfd_altimeter_setting = st.slider(
+            "Altimeter setting (in Hg):", 28.00, 31.00, 29.92, 0.01, key="tfd_altimeter"
+        )
+
+        tfd_start_altitude = st.number_input(
+            "Starting altitude (ft MSL):", min_value=0, max_value=12000, value=0, step=100,
+            key="tfd_start_altitude"
+        )
+
+    with tfd_col2:
+        tfd_end_altitude = st.number_input(
+            "Ending altitude (ft MSL):", min_value=0, max_value=12000, value=6000, step=100,
+            key="tfd_end_altitude"
+        )
     
-    # Coming soon image or placeholder
-    st.info("🚧 This feature is under development and will be available soon! 🚧")
+    if tfd_end_altitude <= tfd_start_altitude:
+        st.error("Ending altitude must be higher than starting altitude.")
+    elif st.button("Calculate Time, Fuel and Distance", type="primary"):
+        try:
+            climb_time, climb_fuel, climb_distance = pf.get_time_fuel_distance_to_climb(
+                pf.get_pressure_altitude(tfd_altimeter_setting, tfd_start_altitude),
+                pf.get_pressure_altitude(tfd_altimeter_setting, tfd_end_altitude),
+            )
+
+            res_col1, res_col2, res_col3 = st.columns(3)
+
+            with res_col1:
+                st.metric("Time to Climb", f"{climb_time:.1f} min")
+
+            with res_col2:
+                st.metric("Fuel to Climb", f"{climb_fuel:.1f} gal")
+
+            with res_col3:
+                st.metric("Distance to Climb", f"{climb_distance:.1f} NM")
+
+        except Exception as e:
+            st.error(f"Calculation error: {str(e)}")
+
+    with st.expander("How are these calculations performed?"):
+        st.markdown("""
+        ### Calculation Methods
+
+        The POH table lists time, fuel and distance to climb from sea level to each
+        pressure altitude. The calculator interpolates the table at the starting and
+        ending pressure altitudes and subtracts the two.
+
+        ### Important Notes
+
+        - The table assumes 2550 lb, flaps up, full throttle, standard temperature and zero wind
+        - Add 1.1 gallons of fuel for engine start, taxi and takeoff allowance
+        - The table covers pressure altitudes from sea level to 12,000 feet
+        - These calculations are for planning purposes only and not a substitute for pilot judgment
+        """)
 
 # Footer
 st.markdown("---")
@@ -1,13 +1,26 @@
 import streamlit as st
 import pandas as pd
+import lookup_172S as lk
 import performance_172S as pf
 import tables_172S as tb
+import user_tables_172S as ut
 
 st.set_page_config(
     page_title="Cruise Performance",
     page_icon="✈️",
 )
 
+
+@st.cache_resource
+def load_cruise_lookup():
+    """
+    Memory-map the dense cruise surfaces once per process, or None if they are not built.
+    """
+    return lk.load_cruise_lookup()
+
+
+cruise_lookup = load_cruise_lookup()
+
 st.title("Cruise Performance")
 st.sidebar.header("Cruise Performance")
 
@@ -19,7 +32,7 @@ based on your aircraft's power settings and flight conditions.
 """)
 
 # Create tabs for different input methods
-tab1, tab2 = st.tabs(["Built-in Data", "Custom Performance Data"])
+tab1, tab2, tab3 = st.tabs(["Built-in Data", "Custom Performance Data", "Altitude Optimizer"])
 
 with tab1:
     st.subheader("Using Built-in Cessna 172S Data")
@@ -159,14 +172,23 @@ with tab1:
     # Calculate button
     if st.button("Calculate Cruise Performance", type="primary"):
         try:
-            # Calculate cruise performance
-            true_airspeed, fuel_flow = pf.calculate_cruise_performance(
-                cruise_altitude,
-                outside_air_temp,
-                rpm,
-                altimeter_setting,
-                manifold_pressure
-            )
+            # Calculate cruise performance, from the precomputed surfaces when built
+            if cruise_lookup is not None:
+                true_airspeed, fuel_flow = lk.lookup_cruise_performance(
+                    cruise_lookup,
+                    pf.get_pressure_altitude(altimeter_setting, cruise_altitude),
+                    outside_air_temp,
+                    rpm,
+                    manifold_pressure
+                )
+            else:
+                true_airspeed, fuel_flow = pf.calculate_cruise_performance(
+                    cruise_altitude,
+                    outside_air_temp,
+                    rpm,
+                    altimeter_setting,
+                    manifold_pressure
+                )
             
             # Calculate endurance
             total_endurance, usable_endurance = pf.calculate_endurance(
@@ -235,10 +257,35 @@ with tab2:
     
     # Performance data table entry
     st.subheader("Performance Chart Data")
+
+    # Full POH cruise chart upload
+    cruise_table_file = st.file_uploader(
+        "Upload POH cruise table (CSV or JSON):",
+        type=["csv", "json"],
+        key="cruise_table_file",
+        help="One row per chart entry with columns pressure_altitude, temperature, "
+             "manifold_pressure (optional), rpm, true_airspeed and fuel_flow"
+    )
+
+    cruise_table = None
+    if cruise_table_file is not None:
+        try:
+            cruise_table = ut.load_user_cruise_table(
+                cruise_table_file.getvalue(),
+                cruise_table_file.name.rsplit(".", 1)[-1].lower()
+            )
+            st.success(
+                "✅ Cruise table loaded, interpolating over "
+                + ", ".join(name.replace("_", " ") for name in cruise_table.axis_names)
+            )
+            if cruise_table.has_manifold_pressure:
+                st.info("ℹ️ This table needs a manifold pressure, so include it below.")
+        except ValueError as e:
+            st.error(f"Could not read the cruise table: {str(e)}")
     
     # Create a simple data entry form
-    with st.expander("📊 Enter Performance Data", expanded=True):
-        st.markdown("**Note:** This is a simplified data entry. Enter base performance values:")
+    with st.expander("📊 Enter Performance Data", expanded=cruise_table is None):
+        st.markdown("**Note:** This is a simplified data entry, used when no cruise table is uploaded. Enter base performance values:")
         
         data_col1, data_col2 = st.columns(2)
         
@@ -420,7 +467,8 @@ with tab2:
                 'base_mp': base_mp,
                 'base_rpm': base_rpm,
                 'base_tas': base_tas,
-                'base_fuel_flow': base_fuel_flow
+                'base_fuel_flow': base_fuel_flow,
+                'cruise_table': cruise_table
             }
             
             # Calculate performance
@@ -470,6 +518,110 @@ with tab2:
         except Exception as e:
             st.error(f"Calculation error: {str(e)}")
 
+with tab3:
+    st.subheader("Best Altitude and Power Setting")
+
+    st.markdown("""
+    Rank every combination of cruise altitude and power setting for a leg, using the
+    winds and temperatures aloft at each altitude.
+    """)
+
+    opt_col1, opt_col2 = st.columns(2)
+
+    with opt_col1:
+        opt_distance = st.number_input(
+            "Leg distance (NM):",
+            min_value=1.0,
+            max_value=1000.0,
+            value=150.0,
+            step=1.0,
+            key="opt_distance"
+        )
+
+        opt_heading = st.slider(
+            "Magnetic heading:", 1, 360, 90, key="opt_heading"
+        )
+
+        opt_altimeter = st.number_input(
+            "Altimeter setting (inHg):",
+            min_value=28.00,
+            max_value=31.00,
+            value=29.92,
+            step=0.01,
+            format="%.2f",
+            key="opt_altimeter"
+        )
+
+    with opt_col2:
+        opt_objective = st.radio(
+            "Optimize for:",
+            ["Least fuel per NM", "Shortest time"],
+            key="opt_objective",
+            help="Least fuel per NM also gives the longest range on a given fuel load"
+        )
+
+        opt_use_mp = st.checkbox(
+            "Aircraft has manifold pressure gauge",
+            value=True,
+            key="opt_use_mp"
+        )
+
+    st.markdown("**Winds and temperatures aloft**")
+    winds_aloft = st.data_editor(
+        pd.DataFrame({
+            "Altitude (ft)": [3000, 6000, 9000, 12000],
+            "Wind direction": [270, 280, 290, 300],
+            "Wind speed (knots)": [10, 15, 20, 25],
+            "Temperature (°C)": [9, 3, -3, -9],
+        }),
+        num_rows="dynamic",
+        key="opt_winds_aloft"
+    )
+
+    if st.button("Find Best Cruise Options", type="primary"):
+        try:
+            winds_aloft = winds_aloft.dropna().sort_values("Altitude (ft)")
+            if winds_aloft.empty:
+                winds_aloft = None
+            else:
+                winds_aloft = winds_aloft.to_numpy(dtype=float)
+
+            options = pf.optimize_cruise(
+                opt_distance,
+                opt_heading,
+                opt_altimeter,
+                winds_aloft,
+                objective="fuel" if opt_objective == "Least fuel per NM" else "time",
+                manifold_pressures=tb.cruise_manifold_pressures if opt_use_mp else None
+            )
+
+            if len(options) == 0:
+                st.error("No altitude and power setting is within the cruise tables.")
+            else:
+                best = options[0]
+                best_col1, best_col2, best_col3 = st.columns(3)
+
+                with best_col1:
+                    st.metric("Best Altitude", f"{best['altitude']:,.0f} ft")
+
+                with best_col2:
+                    st.metric("Time", f"{best['time']:.2f} hours")
+
+                with best_col3:
+                    st.metric("Fuel", f"{best['fuel']:.1f} gallons")
+
+                results = pd.DataFrame(options[:20])
+                if not opt_use_mp:
+                    results = results.drop(columns="manifold_pressure")
+                results["outside_tables"] = results.pop("status") != pf.CRUISE_OK
+                st.dataframe(results, hide_index=True)
+
+                if results["outside_tables"].any():
+                    st.warning("Some options are outside the cruise tables and use the nearest table values.")
+
+        except Exception as e:
+            st.error(f"Calculation error: {str(e)}")
+
 # Information section
 with st.expander("📚 How are these calculations performed?"):
     st.markdown("""
@@ -1,10 +1,31 @@
+import functools
 import math
+from collections.abc import Iterator
 
 import numpy as np
-import scipy as sp
 
+import interpolators_172S as ip
 import tables_172S as tb
 
+# Status flags from get_takeoff_distances_sfto_checked, combined bitwise per scenario
+SFTO_OK = 0
+SFTO_WEIGHT_OUT_OF_RANGE = 1
+SFTO_TEMPERATURE_OUT_OF_RANGE = 2
+SFTO_PRESSURE_ALTITUDE_OUT_OF_RANGE = 4
+
+# Status flags from get_cruise_performance_with_mp and get_cruise_performance_no_mp,
+# combined bitwise per point
+CRUISE_OK = 0
+CRUISE_PRESSURE_ALTITUDE_OUT_OF_RANGE = 1
+CRUISE_TEMPERATURE_OUT_OF_RANGE = 2
+CRUISE_MANIFOLD_PRESSURE_OUT_OF_RANGE = 4
+CRUISE_RPM_OUT_OF_RANGE = 8
+
+# Status flags from get_climb_gradient_compliance, combined bitwise per scenario
+CLIMB_OK = 0
+CLIMB_TEMPERATURE_OUT_OF_RANGE = 1
+CLIMB_PRESSURE_ALTITUDE_OUT_OF_RANGE = 2
+
 
 def get_safety_margin_modifier(safety_margin: float) -> float:
     """
@@ -51,21 +72,57 @@ def get_wind_runway_modifier(
     Compute the multiplier for ground roll based on wind direction and speed given runway heading.
     - Decrease distances 10% for each 9 knots headwind
     - Increase distances by 10% for each 2 knots tailwind
+
+    Accepts scalars or NumPy arrays (broadcast against each other) and returns a
+    modifier of the same shape.
     """
-    wind_runway_difference = (runway_heading - wind_direction) % 360
+    wind_runway_difference = (np.asarray(runway_heading) - wind_direction) % 360
     deg_to_rad_conversion = math.pi / 180
-    wind_component = wind_speed * math.cos(
-        deg_to_rad_conversion * wind_runway_difference
+    wind_component = wind_speed * np.cos(deg_to_rad_conversion * wind_runway_difference)
+
+    # headwind is positive, tailwind negative, no wind leaves the modifier at 1
+    modifier = np.where(
+        wind_component > 0,
+        1 - wind_component * (0.1 / 9),
+        1 - wind_component * (0.1 / 2),
     )
 
-    if wind_component > 0:  # headwind
-        modifier = 1 - wind_component * (0.1 / 9)
-    elif wind_component < 0:  # tailwind
-        modifier = 1 + wind_component * (0.1 / 2)
-    else:  # no wind
-        modifier = 1
+    return modifier[()]
 
-    return modifier
+
+def get_runway_wind_components(
+    runway_headings: np.ndarray, wind_directions: np.ndarray, wind_speeds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resolve a series of wind observations onto every runway end at an airport.
+
+    Args:
+        runway_headings: Headings of each runway end in degrees, shape (runways,)
+        wind_directions: Wind directions in degrees (direction wind is coming from),
+            shape (observations,)
+        wind_speeds: Wind speeds in knots, shape (observations,)
+
+    Returns:
+        Tuple of (headwind, tailwind, crosswind, modifier, best_runway) where the first
+        four are (runways, observations) arrays in knots and as distance multipliers.
+        Headwind and tailwind are both non-negative, crosswind is positive from the
+        right, and best_runway holds the index of the runway end with the most headwind
+        for each observation.
+    """
+    runway_headings = np.asarray(runway_headings, dtype=float)[:, np.newaxis]
+    wind_directions, wind_speeds = np.broadcast_arrays(wind_directions, wind_speeds)
+
+    # Wind angle off each runway end, shape (runways, observations)
+    wind_runway_difference = np.radians((wind_directions - runway_headings) % 360)
+    wind_component = wind_speeds * np.cos(wind_runway_difference)
+    crosswind = wind_speeds * np.sin(wind_runway_difference)
+
+    headwind = np.maximum(wind_component, 0)
+    tailwind = np.maximum(-wind_component, 0)
+    modifier = get_wind_runway_modifier(runway_headings, wind_speeds, wind_directions)
+    best_runway = np.argmax(wind_component, axis=0)
+
+    return headwind, tailwind, crosswind, modifier, best_runway
 
 
 def get_grass_runway_modifier(is_grass: bool) -> float:
@@ -73,11 +130,12 @@ def get_grass_runway_modifier(is_grass: bool) -> float:
     For operation on a dry grass runway, increase distances by 15% of the "ground roll" figure.
     See https://www.boldmethod.com/learn-to-fly/performance/runway-surface-and-slope/
     Return a modifier value of 1.15 if is_grass is True.
+
+    Accepts a bool or a boolean NumPy array and returns a modifier of the same shape.
     """
-    if is_grass:
-        return 1.15
-    else:
-        return 1
+    modifier = np.where(is_grass, 1.15, 1.0)
+
+    return modifier[()]
 
 
 def get_pressure_altitude(altimiter: float, true_altitude: float) -> float:
@@ -106,9 +164,9 @@ def get_ground_roll_sfto(
     """
 
     # Compute ground_roll
-    points = (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index)
-    point = np.array([weight, temperature, pressure_altitude])
-    ground_roll = sp.interpolate.interpn(points, tb.sfto_ground_roll, point)[0]
+    ground_roll = float(
+        ip.sfto_ground_roll_kernel(weight, temperature, pressure_altitude)
+    )
 
     wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
     grass_modifier = get_grass_runway_modifier(is_grass)
@@ -134,9 +192,9 @@ def get_dist_50ft_sfto(
     """
 
     # Compute ground_roll
-    points = (tb.weight_index, tb.temperature_index, tb.pressure_altitude_index)
-    point = np.array([weight, temperature, pressure_altitude])
-    dist_50ft = sp.interpolate.interpn(points, tb.sfto_dist_50_feet, point)[0]
+    dist_50ft = float(
+        ip.sfto_dist_50_feet_kernel(weight, temperature, pressure_altitude)
+    )
 
     wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
     grass_modifier = get_grass_runway_modifier(is_grass)
@@ -146,6 +204,431 @@ def get_dist_50ft_sfto(
     return dist_50ft
 
 
+def get_takeoff_distances_sfto(
+    pressure_altitude: np.ndarray,
+    weight: np.ndarray,
+    temperature: np.ndarray,
+    runway_heading: np.ndarray,
+    wind_direction: np.ndarray,
+    wind_speed: np.ndarray,
+    is_grass: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute short field takeoff ground roll and distance at 50 ft height for many scenarios at once.
+
+    Args:
+        pressure_altitude: Pressure altitudes in feet
+        weight: Aircraft weights in pounds
+        temperature: Temperatures in degrees Celsius
+        runway_heading: Runway headings in degrees
+        wind_direction: Wind directions in degrees (direction wind is coming from)
+        wind_speed: Wind speeds in knots
+        is_grass: True where the runway is dry grass
+
+    All arguments are broadcast against each other, so scalars can be mixed with arrays.
+
+    Returns:
+        Tuple of (ground_roll, dist_50ft) arrays in feet with the broadcast shape
+    """
+    (
+        pressure_altitude,
+        weight,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+    ) = np.broadcast_arrays(
+        pressure_altitude,
+        weight,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+    )
+
+    # Interpolate both tables for every scenario in one call per table
+    scenarios = np.stack([weight, temperature, pressure_altitude], axis=-1)
+    flat_scenarios = scenarios.reshape(-1, 3)
+    ground_roll = ip.sfto_ground_roll(flat_scenarios).reshape(scenarios.shape[:-1])
+    dist_50ft = ip.sfto_dist_50_feet(flat_scenarios).reshape(scenarios.shape[:-1])
+
+    wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
+    grass_modifier = get_grass_runway_modifier(is_grass)
+    modifier = wind_modifier * grass_modifier
+
+    return (ground_roll * modifier)[()], (dist_50ft * modifier)[()]
+
+
+def get_takeoff_distances_sfto_checked(
+    pressure_altitude: np.ndarray,
+    weight: np.ndarray,
+    temperature: np.ndarray,
+    runway_heading: np.ndarray,
+    wind_direction: np.ndarray,
+    wind_speed: np.ndarray,
+    is_grass: np.ndarray,
+    extrapolation: str = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute short field takeoff distances for many scenarios without failing on bad rows.
+
+    Like get_takeoff_distances_sfto, but scenarios outside the takeoff tables (weight
+    2200-2550 lb, temperature 0-40 degC, pressure altitude 0-8000 ft) are flagged in
+    a status array instead of raising ValueError for the whole batch.
+
+    Args:
+        pressure_altitude: Pressure altitudes in feet
+        weight: Aircraft weights in pounds
+        temperature: Temperatures in degrees Celsius
+        runway_heading: Runway headings in degrees
+        wind_direction: Wind directions in degrees (direction wind is coming from)
+        wind_speed: Wind speeds in knots
+        is_grass: True where the runway is dry grass
+        extrapolation: Policy for out of range scenarios
+            - None: return NaN distances
+            - "clamp": hold the distances at the nearest table edge
+            - "linear": extend the edge cells of the tables linearly
+            Scenarios with a NaN weight, temperature or pressure altitude are NaN
+            under every policy.
+
+    Returns:
+        Tuple of (ground_roll, dist_50ft, status) arrays with the broadcast shape, or
+        scalars for scalar input. Status is SFTO_OK or a combination of the
+        SFTO_*_OUT_OF_RANGE flags; it is set for out of range scenarios whatever the
+        extrapolation policy.
+    """
+    (
+        pressure_altitude,
+        weight,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+    ) = np.broadcast_arrays(
+        pressure_altitude,
+        weight,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+    )
+
+    scenarios = np.stack([weight, temperature, pressure_altitude], axis=-1)
+    performance, status = ip.interpolate_within_envelope(
+        ip.sfto_performance, scenarios, extrapolation
+    )
+    ground_roll, dist_50ft = performance[..., 0], performance[..., 1]
+
+    wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
+    grass_modifier = get_grass_runway_modifier(is_grass)
+    modifier = wind_modifier * grass_modifier
+
+    return (ground_roll * modifier)[()], (dist_50ft * modifier)[()], status[()]
+
+
+def get_takeoff_forecast_sfto(
+    elevation: float,
+    weight: float,
+    runway_headings: np.ndarray,
+    runway_lengths: np.ndarray,
+    is_grass: np.ndarray,
+    temperatures: np.ndarray,
+    altimeters: np.ndarray,
+    wind_directions: np.ndarray,
+    wind_speeds: np.ndarray,
+    extrapolation: str = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute short field takeoff distances for every runway and every hour of a forecast.
+
+    Args:
+        elevation: Airport elevation in feet MSL
+        weight: Aircraft weight in pounds
+        runway_headings: Heading of each runway end in degrees, shape (runways,)
+        runway_lengths: Runway available for each runway end in feet, shape (runways,)
+        is_grass: True where the runway is dry grass, scalar or shape (runways,)
+        temperatures: Hourly temperatures in degrees Celsius, shape (hours,)
+        altimeters: Hourly altimeter settings in inches Hg, shape (hours,)
+        wind_directions: Hourly wind directions in degrees, shape (hours,)
+        wind_speeds: Hourly wind speeds in knots, shape (hours,)
+        extrapolation: Policy for hours outside the takeoff tables, as in
+            get_takeoff_distances_sfto_checked
+
+    Returns:
+        Tuple of (ground_roll, dist_50ft, status, earliest_hour). The first three are
+        (runways, hours) arrays as returned by get_takeoff_distances_sfto_checked.
+        earliest_hour holds, for each runway, the index of the first hour whose distance
+        to clear 50 ft fits within the runway length, or -1 if no hour does.
+    """
+    runway_headings = np.asarray(runway_headings)[:, np.newaxis]
+    runway_lengths = np.asarray(runway_lengths)[:, np.newaxis]
+    is_grass = np.broadcast_to(is_grass, runway_headings.shape[:1])[:, np.newaxis]
+    pressure_altitude = get_pressure_altitude(np.asarray(altimeters), elevation)
+
+    ground_roll, dist_50ft, status = get_takeoff_distances_sfto_checked(
+        pressure_altitude,
+        weight,
+        temperatures,
+        runway_headings,
+        wind_directions,
+        wind_speeds,
+        is_grass,
+        extrapolation,
+    )
+
+    # NaN distances compare False, so out of range hours never satisfy the constraint
+    fits = dist_50ft <= runway_lengths
+    earliest_hour = np.where(fits.any(axis=1), np.argmax(fits, axis=1), -1)
+
+    return ground_roll, dist_50ft, status, earliest_hour
+
+
+def get_short_field_takeoff_performance(
+    pressure_altitude: float,
+    weight: float,
+    temperature: float,
+    runway_heading: float,
+    wind_direction: float,
+    wind_speed: float,
+    is_grass: bool,
+) -> tuple[float, float, float, float]:
+    """
+    Compute the short field takeoff ground roll, distance at 50 ft obstacle, lift off speed,
+    and speed at 50 ft in a single interpolation pass.
+
+    Args:
+        pressure_altitude: Pressure altitude in feet
+        weight: Aircraft weight in pounds
+        temperature: Temperature in degrees Celsius
+        runway_heading: Runway heading in degrees
+        wind_direction: Wind direction in degrees (direction wind is coming from)
+        wind_speed: Wind speed in knots
+        is_grass: True if the runway is dry grass
+
+    Arguments may be scalars or NumPy arrays, which are broadcast against each other.
+
+    Returns:
+        Tuple of (ground_roll, dist_50ft, lift_off_speed, speed_at_50ft) in feet and knots,
+        as floats for scalar input or arrays of the broadcast shape
+    """
+    point = np.stack(
+        np.broadcast_arrays(weight, temperature, pressure_altitude), axis=-1
+    )
+    if point.ndim == 1:
+        performance = ip.sfto_performance_kernel(*point.tolist())
+    else:
+        performance = ip.sfto_performance(point.reshape(-1, 3))
+        performance = performance.reshape(point.shape[:-1] + (4,))
+    ground_roll, dist_50ft, lift_off_speed, speed_at_50ft = np.moveaxis(
+        performance, -1, 0
+    )
+
+    wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
+    grass_modifier = get_grass_runway_modifier(is_grass)
+    modifier = wind_modifier * grass_modifier
+
+    ground_roll = ground_roll * modifier
+    dist_50ft = dist_50ft * modifier
+
+    return ground_roll[()], dist_50ft[()], lift_off_speed[()], speed_at_50ft[()]
+
+
+def get_max_weight_sfto(
+    pressure_altitude: float,
+    temperature: float,
+    runway_heading: float,
+    wind_direction: float,
+    wind_speed: float,
+    is_grass: bool,
+    runway_length: float,
+) -> float:
+    """
+    Compute the heaviest takeoff weight that clears a 50 ft obstacle within the available runway.
+
+    This inverts get_dist_50ft_sfto. With temperature and pressure altitude fixed, the
+    interpolated distance is linear in weight inside each weight cell and increases with
+    weight (as tb.sfto_dist_50_feet does), so the answer is found in closed form from the
+    distances at the tabulated weights.
+
+    Args:
+        pressure_altitude: Pressure altitude in feet
+        temperature: Temperature in degrees Celsius
+        runway_heading: Runway heading in degrees
+        wind_direction: Wind direction in degrees (direction wind is coming from)
+        wind_speed: Wind speed in knots
+        is_grass: True if the runway is dry grass
+        runway_length: Runway available in feet
+
+    Arguments may be scalars or NumPy arrays, which are broadcast against each other.
+
+    Returns:
+        Maximum weight in pounds, capped at the heaviest tabulated weight, and NaN where
+        even the lightest tabulated weight needs more runway than is available
+    """
+    (
+        pressure_altitude,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+        runway_length,
+    ) = np.broadcast_arrays(
+        pressure_altitude,
+        temperature,
+        runway_heading,
+        wind_direction,
+        wind_speed,
+        is_grass,
+        runway_length,
+    )
+
+    # Distance at every tabulated weight for each scenario, shape (..., weights)
+    weights = ip.sfto_dist_50_feet.grid[0]
+    points = np.stack(
+        np.broadcast_arrays(
+            weights, temperature[..., np.newaxis], pressure_altitude[..., np.newaxis]
+        ),
+        axis=-1,
+    )
+    node_distances = ip.sfto_dist_50_feet(points.reshape(-1, 3))
+    node_distances = node_distances.reshape(points.shape[:-1])
+
+    wind_modifier = get_wind_runway_modifier(runway_heading, wind_speed, wind_direction)
+    grass_modifier = get_grass_runway_modifier(is_grass)
+    node_distances *= (wind_modifier * grass_modifier)[..., np.newaxis]
+
+    # Distances increase with weight, so the count of fitting nodes picks the cell
+    fits = np.sum(node_distances <= runway_length[..., np.newaxis], axis=-1)
+    lower = np.clip(fits - 1, 0, len(weights) - 2)[..., np.newaxis]
+    lower_distance = np.take_along_axis(node_distances, lower, axis=-1)[..., 0]
+    upper_distance = np.take_along_axis(node_distances, lower + 1, axis=-1)[..., 0]
+    lower = lower[..., 0]
+
+    fraction = (runway_length - lower_distance) / (upper_distance - lower_distance)
+    max_weight = weights[lower] + fraction * (weights[lower + 1] - weights[lower])
+    max_weight = np.where(fits == len(weights), weights[-1], max_weight)
+    max_weight = np.where(fits == 0, np.nan, max_weight)
+
+    return max_weight[()]
+
+
+def simulate_dist_50ft_sfto(
+    elevation: float,
+    altimeter: float,
+    weight: float,
+    temperature: float,
+    runway_heading: float,
+    wind_direction: float,
+    wind_speed: float,
+    is_grass: bool,
+    temperature_sd: float = 2.0,
+    altimeter_sd: float = 0.02,
+    gust_speed: float = None,
+    weight_sd: float = 20.0,
+    n_samples: int = 1_000_000,
+    percentiles: tuple[float, ...] = (50, 90, 99),
+    bin_edges: np.ndarray = None,
+    seed: int | np.random.Generator = None,
+    chunk_size: int = 100_000,
+    extrapolation: str = "linear",
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """
+    Estimate the distribution of the short field takeoff distance at 50 ft by Monte Carlo.
+
+    Temperature, altimeter setting and weight are drawn from normal distributions around
+    the given values, and wind speed uniformly between the steady wind and the gust speed.
+    Samples are drawn and evaluated chunk_size at a time and only a histogram is kept,
+    so memory stays bounded however many samples are requested.
+
+    Near the edges of the takeoff tables many samples fall outside them; at 2550 lb,
+    the maximum weight, about half of all samples are heavier than the tables. Those
+    samples are handled by the extrapolation policy and counted in the returned
+    out of envelope fraction. Holding them at the table edges ("clamp") biases the
+    upper percentiles short, by about 4.5% at the 99th percentile for 2550 lb at
+    38 degC, so the default extends the tables linearly instead.
+
+    Args:
+        elevation: Airport elevation in feet MSL
+        altimeter: Altimeter setting in inches Hg
+        weight: Aircraft weight in pounds
+        temperature: Temperature in degrees Celsius
+        runway_heading: Runway heading in degrees
+        wind_direction: Wind direction in degrees (direction wind is coming from)
+        wind_speed: Steady wind speed in knots
+        is_grass: True if the runway is dry grass
+        temperature_sd: Standard deviation of temperature in degrees Celsius
+        altimeter_sd: Standard deviation of the altimeter setting in inches Hg
+        gust_speed: Gust speed in knots, or None for a steady wind
+        weight_sd: Standard deviation of the actual weight in pounds
+        n_samples: Number of samples to draw
+        percentiles: Percentiles to report, between 0 and 100
+        bin_edges: Histogram bin edges in feet, 10 ft bins from 0 to 10000 ft by default.
+            Distances outside the edges are counted in the first or last bin.
+        seed: Seed or np.random.Generator, for reproducible results
+        chunk_size: Number of samples evaluated at once
+        extrapolation: Policy for samples outside the takeoff tables, as for
+            get_takeoff_distances_sfto_checked. With None those samples are left out
+            of the histogram and the percentiles, and if every sample is outside the
+            tables the percentile distances are NaN.
+
+    Returns:
+        Tuple of (distances at the requested percentiles, histogram counts, bin edges,
+        fraction of samples outside the takeoff tables)
+    """
+    rng = np.random.default_rng(seed)
+    if bin_edges is None:
+        bin_edges = np.arange(0, 10010, 10)
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    if gust_speed is None:
+        gust_speed = wind_speed
+
+    modifier_grass = get_grass_runway_modifier(is_grass)
+    counts = np.zeros(len(bin_edges) - 1, dtype=np.int64)
+    out_of_envelope_count = 0
+
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+
+        sample_temperature = rng.normal(temperature, temperature_sd, size)
+        sample_altimeter = rng.normal(altimeter, altimeter_sd, size)
+        sample_weight = rng.normal(weight, weight_sd, size)
+        sample_wind_speed = rng.uniform(wind_speed, gust_speed, size)
+        sample_pressure_altitude = get_pressure_altitude(sample_altimeter, elevation)
+
+        points = np.stack(
+            [sample_weight, sample_temperature, sample_pressure_altitude], axis=-1
+        )
+        dist_50ft, status = ip.interpolate_within_envelope(
+            ip.sfto_dist_50_feet, points, extrapolation
+        )
+        out_of_envelope_count += np.count_nonzero(status)
+        dist_50ft *= modifier_grass * get_wind_runway_modifier(
+            runway_heading, sample_wind_speed, wind_direction
+        )
+
+        dist_50ft = dist_50ft[~np.isnan(dist_50ft)]
+        dist_50ft = np.clip(dist_50ft, bin_edges[0], bin_edges[-1])
+        counts += np.histogram(dist_50ft, bin_edges)[0]
+
+    out_of_envelope_fraction = out_of_envelope_count / n_samples
+    if counts.sum() == 0:
+        percentile_distances = np.full(np.shape(percentiles), np.nan)
+        return percentile_distances, counts, bin_edges, out_of_envelope_fraction
+
+    # Read percentiles off the cumulative histogram, linear within each bin
+    cumulative = np.concatenate([[0.0], np.cumsum(counts) / counts.sum()])
+    percentile_distances = np.interp(
+        np.asarray(percentiles) / 100, cumulative, bin_edges
+    )
+
+    return percentile_distances, counts, bin_edges, out_of_envelope_fraction
+
+
 def get_lift_off_speed(weight: float) -> float:
     """
     Compute the lift off speed in knots for a short field takeoff.
@@ -154,9 +637,7 @@ def get_lift_off_speed(weight: float) -> float:
     """
 
     # Compute lift_off_speed
-    lift_off_speed = np.interp(
-        np.array(weight), tb.weight_index[::-1], tb.lift_off_index[::-1]
-    )
+    lift_off_speed = np.interp(np.array(weight), *ip.lift_off_speed)
 
     return lift_off_speed
 
@@ -169,9 +650,7 @@ def get_speed_at_50ft(weight: float) -> float:
     """
 
     # Compute lift_off_speed
-    speed_at_50ft = np.interp(
-        np.array(weight), tb.weight_index[::-1], tb.speed_at_50_feet_index[::-1]
-    )
+    speed_at_50ft = np.interp(np.array(weight), *ip.speed_at_50_feet)
 
     return speed_at_50ft
 
@@ -218,7 +697,7 @@ def get_true_airspeed(
     density_ratio = pressure_ratio / temp_ratio
     
     # True airspeed calculation
-    true_airspeed = indicated_airspeed / math.sqrt(density_ratio)
+    true_airspeed = indicated_airspeed / np.sqrt(density_ratio)
     
     return true_airspeed
 
@@ -250,12 +729,12 @@ def get_ground_speed(
     
     # Calculate wind components
     # Positive component means headwind (reduces ground speed)
-    headwind_component = wind_speed * math.cos(deg_to_rad * relative_wind_angle)
+    headwind_component = wind_speed * np.cos(deg_to_rad * relative_wind_angle)
     
     # Ground speed = TAS - headwind component (headwind reduces ground speed)
     ground_speed = true_airspeed - headwind_component
     
-    return max(0, ground_speed)  # Ensure non-negative ground speed
+    return np.maximum(0, ground_speed)  # Ensure non-negative ground speed
 
 
 def interpolate_parameter(
@@ -288,11 +767,244 @@ def interpolate_parameter(
     return interpolated_value
 
 
+def get_max_rate_of_climb(
+    pressure_altitude: float, temperature: float, extrapolation: str = None
+) -> float:
+    """
+    Compute the maximum rate of climb at max gross weight from the POH table.
+
+    Args:
+        pressure_altitude: Pressure altitude in feet
+        temperature: Temperature in degrees Celsius
+        extrapolation: Policy for points outside the table (up to 12000 ft, -20 to
+            40 degC), as for get_takeoff_distances_sfto_checked. By default they are NaN.
+
+    Arguments may be scalars or NumPy arrays, which are broadcast against each other.
+    Pressure altitudes below sea level, usual at low fields with a high altimeter
+    setting, are taken as sea level as in the POH.
+
+    Returns:
+        Rate of climb in feet per minute
+    """
+    pressure_altitude = np.maximum(pressure_altitude, 0)
+    points = np.stack(np.broadcast_arrays(temperature, pressure_altitude), axis=-1)
+    rate_of_climb, _ = ip.interpolate_within_envelope(
+        ip.max_rate_of_climb, points, extrapolation
+    )
+
+    return rate_of_climb[()]
+
+
+def _climb_sample_altitudes(
+    start_altitude: float, end_altitude: float, sample_interval: float
+) -> np.ndarray:
+    """
+    Sample a climb every sample_interval feet from the start altitude, always ending
+    exactly at the end altitude.
+    """
+    sample_altitudes = np.arange(
+        start_altitude, end_altitude, sample_interval, dtype=float
+    )
+    return np.append(sample_altitudes, end_altitude)
+
+
+def interpolate_winds_aloft(
+    winds_aloft: np.ndarray, altitude: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Interpolate a winds aloft profile to arbitrary altitudes.
+
+    Wind is interpolated as east/north vector components, so a veering wind turns
+    through the short way round and a wind reversing between levels weakens instead of
+    swinging through every direction at full strength.
+
+    Args:
+        winds_aloft: Profile array of shape (levels, 4) with columns altitude (feet,
+            ascending), wind direction (degrees, direction wind is coming from), wind
+            speed (knots) and temperature (degrees Celsius)
+        altitude: Altitudes to interpolate to in feet, any shape
+
+    Values are held constant above the highest and below the lowest level.
+
+    Returns:
+        Tuple of (wind_direction, wind_speed, temperature) arrays shaped like altitude
+    """
+    winds_aloft = np.asarray(winds_aloft, dtype=float)
+    levels, directions, speeds, temperatures = winds_aloft.T
+
+    # Components of the wind blowing from each direction
+    east = -speeds * np.sin(np.radians(directions))
+    north = -speeds * np.cos(np.radians(directions))
+    east = np.interp(altitude, levels, east)
+    north = np.interp(altitude, levels, north)
+
+    wind_speed = np.hypot(east, north)
+    wind_direction = np.degrees(np.arctan2(-east, -north)) % 360
+    temperature = np.interp(altitude, levels, temperatures)
+
+    return wind_direction, wind_speed, temperature
+
+
+def _climb_performance(
+    altitude: np.ndarray,
+    ratio: np.ndarray,
+    start_climb_rate: float,
+    end_climb_rate: float,
+    indicated_airspeed: float,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute climb rate, true airspeed and ground speed at points along a climb.
+
+    Args:
+        altitude: Altitudes in feet MSL
+        ratio: Fraction of the climb completed at each altitude, used to interpolate
+            climb rate, temperature, wind and heading between their start and end values
+
+    The remaining arguments are as for calculate_climb_gradient. All arguments except
+    winds_aloft are broadcast against each other.
+
+    Returns:
+        Tuple of (climb_rate, true_airspeed, ground_speed) arrays in feet per minute
+        and knots
+    """
+    if winds_aloft is not None:
+        wind_dir, wind_speed, temp = interpolate_winds_aloft(winds_aloft, altitude)
+    else:
+        temp = start_temp + ratio * (end_temp - start_temp)
+        wind_dir = start_wind_dir + ratio * (end_wind_dir - start_wind_dir)
+        wind_speed = start_wind_speed + ratio * (end_wind_speed - start_wind_speed)
+
+    # Handle magnetic heading interpolation (circular)
+    heading_diff = (end_heading - start_heading) % 360
+    heading_diff = heading_diff - 360 * (heading_diff > 180)
+    heading = (start_heading + ratio * heading_diff) % 360
+
+    pressure_altitude = get_pressure_altitude(altimeter_setting, altitude)
+    true_airspeed = get_true_airspeed(indicated_airspeed, pressure_altitude, temp)
+    ground_speed = get_ground_speed(true_airspeed, heading, wind_dir, wind_speed)
+
+    # Climb rate from the maximum rate of climb table when none is given
+    if start_climb_rate is None and end_climb_rate is None:
+        climb_rate = get_max_rate_of_climb(pressure_altitude, temp)
+    else:
+        climb_rate = start_climb_rate + ratio * (end_climb_rate - start_climb_rate)
+
+    return climb_rate, true_airspeed, ground_speed
+
+
+@functools.cache
+def _gauss_legendre(node_count: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gauss-Legendre nodes and weights for integrating over [0, 1].
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(node_count)
+    return (nodes + 1) / 2, weights / 2
+
+
+def _climb_quadrature(
+    tolerance: float,
+    start_altitude: np.ndarray,
+    end_altitude: np.ndarray,
+    start_climb_rate: np.ndarray,
+    end_climb_rate: np.ndarray,
+    start_indicated_airspeed: np.ndarray,
+    start_temp: np.ndarray,
+    end_temp: np.ndarray,
+    start_wind_dir: np.ndarray,
+    start_wind_speed: np.ndarray,
+    end_wind_dir: np.ndarray,
+    end_wind_speed: np.ndarray,
+    start_heading: np.ndarray,
+    end_heading: np.ndarray,
+    altimeter_setting: np.ndarray,
+    winds_aloft: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrate the ground distance covered in a climb by Gauss-Legendre quadrature.
+
+    Climb rate, temperature, wind and heading all vary linearly with altitude, so the
+    distance integrand is smooth and a few nodes are enough whatever the climb height.
+    The node count doubles from 2 until the distance changes by no more than tolerance
+    (relative) for every profile, up to 256 nodes.
+
+    Arguments are as for calculate_climb_gradient, broadcast against each other with
+    the quadrature nodes along a new last axis. Pass profile arrays with a trailing axis
+    of length 1.
+
+    Returns:
+        Tuple of (max_true_airspeed, max_ground_speed, total_distance) over the nodes,
+        with the last axis reduced
+    """
+    altitude_change = end_altitude - start_altitude
+    node_count = 2
+    previous_distance = None
+
+    while True:
+        ratio, weights = _gauss_legendre(node_count)
+        altitude = start_altitude + ratio * altitude_change
+        climb_rate, true_airspeed, ground_speed = _climb_performance(
+            altitude,
+            ratio,
+            start_climb_rate,
+            end_climb_rate,
+            start_indicated_airspeed,
+            start_temp,
+            end_temp,
+            start_wind_dir,
+            start_wind_speed,
+            end_wind_dir,
+            end_wind_speed,
+            start_heading,
+            end_heading,
+            altimeter_setting,
+            winds_aloft,
+        )
+
+        # Nautical miles per foot climbed, zero where the aircraft is not climbing and
+        # NaN where the climb rate is unknown (outside the rate of climb table)
+        distance_per_foot = np.divide(
+            ground_speed / 60,
+            climb_rate,
+            out=np.zeros_like(ground_speed),
+            where=~(climb_rate <= 0),
+        )
+        total_distance = np.sum(weights * distance_per_foot * altitude_change, axis=-1)
+
+        if previous_distance is not None and (
+            node_count >= 256
+            or np.all(
+                (
+                    np.abs(total_distance - previous_distance)
+                    <= tolerance * np.abs(total_distance)
+                )
+                | np.isnan(total_distance)
+            )
+        ):
+            break
+        previous_distance = total_distance
+        node_count *= 2
+
+    max_true_airspeed = true_airspeed.max(axis=-1, initial=0)
+    max_ground_speed = ground_speed.max(axis=-1, initial=0)
+
+    return max_true_airspeed, max_ground_speed, total_distance
+
+
 def calculate_climb_gradient(
     start_altitude: float,
     end_altitude: float,
-    start_climb_rate: float,
-    end_climb_rate: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
     start_indicated_airspeed: float,
     start_temp: float,
     end_temp: float,
@@ -302,11 +1014,27 @@ def calculate_climb_gradient(
     end_wind_speed: float,
     start_heading: float,
     end_heading: float,
-    altimeter_setting: float
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+    tolerance: float = None,
 ) -> tuple[float, float, float]:
     """
     Calculate climb performance including max true airspeed, max ground speed, 
     and minimum climb gradient.
+
+    By default the climb is split into 500 ft segments and every segment is evaluated
+    at its midpoint altitude in one set of array operations. Pass a relative tolerance
+    to integrate the climb by quadrature instead, with as many sample points as that
+    accuracy needs; its cost does not grow with the height of the climb.
+
+    Pass None for both climb rates to take the rate at every point from the maximum
+    rate of climb table, using the pressure altitude and interpolated temperature
+    (see get_max_rate_of_climb). If the climb leaves the table, the climb gradient is
+    NaN rather than an error.
+
+    Pass a winds aloft profile (see interpolate_winds_aloft) to take temperature and
+    wind at every point from it; the start and end temperatures and winds are then
+    ignored.
     
     Returns:
         Tuple of (max_true_airspeed, max_ground_speed, min_climb_gradient_ft_per_nm)
@@ -314,88 +1042,892 @@ def calculate_climb_gradient(
     altitude_change = end_altitude - start_altitude
     if altitude_change <= 0:
         return 0.0, 0.0, 0.0
-    
-    # Sample points throughout the climb (every 500 feet)
-    sample_interval = 500
-    sample_altitudes = []
-    current_alt = start_altitude
-    while current_alt <= end_altitude:
-        sample_altitudes.append(current_alt)
-        current_alt += sample_interval
-    
-    # Ensure we include the end altitude
-    if sample_altitudes[-1] != end_altitude:
-        sample_altitudes.append(end_altitude)
-    
-    max_true_airspeed = 0.0
-    max_ground_speed = 0.0
-    total_time = 0.0
-    total_distance = 0.0
-    
-    # Calculate performance at each sample point
-    for i, altitude in enumerate(sample_altitudes[:-1]):
-        next_altitude = sample_altitudes[i + 1]
-        segment_altitude_change = next_altitude - altitude
-        
-        # Interpolate parameters for this segment
-        avg_altitude = (altitude + next_altitude) / 2
-        
-        # Interpolate climb rate
-        climb_rate = interpolate_parameter(
-            start_altitude, end_altitude, avg_altitude, start_climb_rate, end_climb_rate
-        )
-        
-        # Interpolate temperature  
-        temp = interpolate_parameter(
-            start_altitude, end_altitude, avg_altitude, start_temp, end_temp
+
+    if tolerance is not None:
+        max_true_airspeed, max_ground_speed, total_distance = _climb_quadrature(
+            tolerance,
+            start_altitude,
+            end_altitude,
+            start_climb_rate,
+            end_climb_rate,
+            start_indicated_airspeed,
+            start_temp,
+            end_temp,
+            start_wind_dir,
+            start_wind_speed,
+            end_wind_dir,
+            end_wind_speed,
+            start_heading,
+            end_heading,
+            altimeter_setting,
+            winds_aloft,
         )
-        
-        # Interpolate wind conditions
-        wind_dir = interpolate_parameter(
-            start_altitude, end_altitude, avg_altitude, start_wind_dir, end_wind_dir
+        min_climb_gradient = (
+            altitude_change / total_distance if not total_distance <= 0 else 0.0
         )
-        wind_speed = interpolate_parameter(
-            start_altitude, end_altitude, avg_altitude, start_wind_speed, end_wind_speed
+        return (
+            float(max_true_airspeed),
+            float(max_ground_speed),
+            float(min_climb_gradient),
         )
-        
-        # Interpolate heading
-        # Handle magnetic heading interpolation (circular)
-        heading_diff = (end_heading - start_heading) % 360
-        if heading_diff > 180:
-            heading_diff -= 360
-        heading = (start_heading + interpolate_parameter(
-            start_altitude, end_altitude, avg_altitude, 0, heading_diff
-        )) % 360
-        
-        # Calculate pressure altitude for this segment
-        pressure_altitude = get_pressure_altitude(altimeter_setting, avg_altitude)
-        
-        # Calculate true airspeed
-        true_airspeed = get_true_airspeed(start_indicated_airspeed, pressure_altitude, temp)
-        max_true_airspeed = max(max_true_airspeed, true_airspeed)
-        
-        # Calculate ground speed
-        ground_speed = get_ground_speed(true_airspeed, heading, wind_dir, wind_speed)
-        max_ground_speed = max(max_ground_speed, ground_speed)
-        
-        # Calculate time and distance for this segment
-        if climb_rate > 0:
-            segment_time = segment_altitude_change / climb_rate  # minutes
-            segment_distance = (ground_speed / 60) * segment_time  # nautical miles
-            
-            total_time += segment_time
-            total_distance += segment_distance
-    
-    # Calculate minimum climb gradient in ft/nm
-    min_climb_gradient = altitude_change / total_distance if total_distance > 0 else 0.0
+
+    # Evaluate every 500 ft segment of the climb at its midpoint
+    sample_altitudes = _climb_sample_altitudes(start_altitude, end_altitude, 500)
+    _, true_airspeed, ground_speed, _, segment_distance = _climb_segments(
+        sample_altitudes[:-1],
+        sample_altitudes[1:],
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+    total_distance = segment_distance.sum()
+
+    max_true_airspeed = max(0.0, float(true_airspeed.max()))
+    max_ground_speed = max(0.0, float(ground_speed.max()))
+
+    # Calculate minimum climb gradient in ft/nm, NaN if the climb rate is unknown
+    min_climb_gradient = (
+        altitude_change / total_distance if not total_distance <= 0 else 0.0
+    )
     
-    return max_true_airspeed, max_ground_speed, min_climb_gradient
+    return max_true_airspeed, max_ground_speed, float(min_climb_gradient)
 
 
-def calculate_cruise_performance(
-    altitude: float,
-    temperature: float,
-    rpm: float,
+def _climb_segments(
+    lower_altitude: np.ndarray,
+    upper_altitude: np.ndarray,
+    start_altitude: float,
+    end_altitude: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
+    start_indicated_airspeed: float,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate climb segments between lower and upper altitudes at their midpoints.
+
+    Returns:
+        Tuple of (altitude, true_airspeed, ground_speed, time, distance) arrays, one
+        entry per segment
+    """
+    avg_altitude = (lower_altitude + upper_altitude) / 2
+    ratio = (avg_altitude - start_altitude) / (end_altitude - start_altitude)
+
+    climb_rate, true_airspeed, ground_speed = _climb_performance(
+        avg_altitude,
+        ratio,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+
+    # Segments without a positive climb rate add no time or distance, and segments
+    # outside the rate of climb table (NaN climb rate) give NaN
+    segment_time = np.divide(
+        upper_altitude - lower_altitude,
+        climb_rate,
+        out=np.zeros_like(climb_rate),
+        where=~(climb_rate <= 0),
+    )  # minutes
+    segment_distance = (ground_speed / 60) * segment_time  # nautical miles
+
+    return avg_altitude, true_airspeed, ground_speed, segment_time, segment_distance
+
+
+def iterate_climb_profile(
+    start_altitude: float,
+    end_altitude: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
+    start_indicated_airspeed: float,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+    sample_interval: float = 500,
+    block_size: int = 1024,
+) -> Iterator[tuple[float, float, float, float, float]]:
+    """
+    Yield the segments of a climb one at a time.
+
+    Segments are sample_interval feet tall (the last one may be shorter) and are
+    evaluated block_size at a time with array operations, so a very finely sampled
+    climb never holds more than one block in memory.
+
+    Arguments are as for calculate_climb_gradient.
+
+    Yields:
+        Tuple of (altitude, true_airspeed, ground_speed, time, distance) per segment,
+        with the midpoint altitude in feet MSL, speeds in knots, time in minutes and
+        distance in nautical miles
+    """
+    if end_altitude <= start_altitude:
+        return
+
+    segment_count = math.ceil((end_altitude - start_altitude) / sample_interval)
+    for first_segment in range(0, segment_count, block_size):
+        segment_index = np.arange(
+            first_segment, min(first_segment + block_size, segment_count)
+        )
+        lower_altitude = start_altitude + segment_index * float(sample_interval)
+        upper_altitude = np.minimum(lower_altitude + sample_interval, end_altitude)
+
+        segments = _climb_segments(
+            lower_altitude,
+            upper_altitude,
+            start_altitude,
+            end_altitude,
+            start_climb_rate,
+            end_climb_rate,
+            start_indicated_airspeed,
+            start_temp,
+            end_temp,
+            start_wind_dir,
+            start_wind_speed,
+            end_wind_dir,
+            end_wind_speed,
+            start_heading,
+            end_heading,
+            altimeter_setting,
+            winds_aloft,
+        )
+        yield from zip(*(value.tolist() for value in segments))
+
+
+def calculate_climb_profile(
+    start_altitude: float,
+    end_altitude: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
+    start_indicated_airspeed: float,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+    sample_interval: float = 500,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate every segment of a climb at once.
+
+    Arguments are as for calculate_climb_gradient. With the default sample_interval the
+    segments are the ones calculate_climb_gradient sums over.
+
+    Returns:
+        Tuple of (altitude, true_airspeed, ground_speed, time, distance) arrays, one
+        entry per segment, in the units of iterate_climb_profile. Empty if the climb
+        does not climb.
+    """
+    if end_altitude <= start_altitude:
+        return tuple(np.empty(0) for _ in range(5))
+
+    sample_altitudes = _climb_sample_altitudes(
+        start_altitude, end_altitude, sample_interval
+    )
+    return _climb_segments(
+        sample_altitudes[:-1],
+        sample_altitudes[1:],
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+
+
+def _climb_padded_segments(
+    start_altitude: np.ndarray,
+    end_altitude: np.ndarray,
+    start_climb_rate: np.ndarray,
+    end_climb_rate: np.ndarray,
+    start_indicated_airspeed: np.ndarray,
+    start_temp: np.ndarray,
+    end_temp: np.ndarray,
+    start_wind_dir: np.ndarray,
+    start_wind_speed: np.ndarray,
+    end_wind_dir: np.ndarray,
+    end_wind_speed: np.ndarray,
+    start_heading: np.ndarray,
+    end_heading: np.ndarray,
+    altimeter_setting: np.ndarray,
+    winds_aloft: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Integrate climbs of different heights in 500 ft segments on one padded grid.
+
+    Arguments are as for calculate_climb_gradient, as profile arrays with a trailing
+    axis of length 1. Segments run along that axis, padded to the tallest climb, and a
+    mask drops the padding segments past each profile's end.
+
+    Returns:
+        Tuple of (max_true_airspeed, max_ground_speed, total_distance) per profile
+    """
+    sample_interval = 500
+    altitude_change = end_altitude - start_altitude
+    is_climb = altitude_change > 0
+    segment_count = np.where(is_climb, np.ceil(altitude_change / sample_interval), 0)
+    segment_index = np.arange(int(segment_count.max(initial=0)))
+    is_segment = segment_index < segment_count
+
+    # Padding segments collapse onto the end altitude so they stay inside the atmosphere
+    lower_altitude = start_altitude + segment_index * sample_interval
+    top_altitude = np.maximum(end_altitude, start_altitude)
+    lower_altitude = np.minimum(lower_altitude, top_altitude)
+    upper_altitude = np.minimum(lower_altitude + sample_interval, end_altitude)
+    avg_altitude = (lower_altitude + upper_altitude) / 2
+    ratio = np.divide(
+        avg_altitude - start_altitude,
+        altitude_change,
+        out=np.zeros_like(avg_altitude),
+        where=is_climb,
+    )
+
+    climb_rate, true_airspeed, ground_speed = _climb_performance(
+        avg_altitude,
+        ratio,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+
+    # Padding and segments without a positive climb rate add no time or distance, and
+    # segments outside the rate of climb table (NaN climb rate) give NaN
+    is_climbing = is_segment & ~(climb_rate <= 0)
+    segment_time = np.divide(
+        upper_altitude - lower_altitude,
+        climb_rate,
+        out=np.zeros_like(climb_rate),
+        where=is_climbing,
+    )  # minutes
+    segment_distance = (ground_speed / 60) * segment_time  # nautical miles
+    total_distance = segment_distance.sum(axis=-1)
+
+    max_true_airspeed = np.where(is_segment, true_airspeed, 0).max(axis=-1, initial=0)
+    max_ground_speed = np.where(is_segment, ground_speed, 0).max(axis=-1, initial=0)
+
+    return max_true_airspeed, max_ground_speed, total_distance
+
+
+def _profile_arrays(*values: np.ndarray) -> list[np.ndarray]:
+    """
+    Broadcast per-profile arguments against each other and add a trailing axis for
+    segments or quadrature nodes. Arguments that are None are passed through.
+    """
+    present = [value for value in values if value is not None]
+    arrays = iter(
+        np.asarray(value, dtype=float)[..., np.newaxis]
+        for value in np.broadcast_arrays(*present)
+    )
+    return [None if value is None else next(arrays) for value in values]
+
+
+def calculate_climb_gradients(
+    start_altitude: np.ndarray,
+    end_altitude: np.ndarray,
+    start_climb_rate: np.ndarray,
+    end_climb_rate: np.ndarray,
+    start_indicated_airspeed: np.ndarray,
+    start_temp: np.ndarray,
+    end_temp: np.ndarray,
+    start_wind_dir: np.ndarray,
+    start_wind_speed: np.ndarray,
+    end_wind_dir: np.ndarray,
+    end_wind_speed: np.ndarray,
+    start_heading: np.ndarray,
+    end_heading: np.ndarray,
+    altimeter_setting: np.ndarray,
+    winds_aloft: np.ndarray = None,
+    tolerance: float = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate climb performance for many climb profiles at once.
+
+    Takes the same arguments as calculate_climb_gradient, as arrays with one entry per
+    profile (scalars are broadcast), including None for both climb rates to use the
+    maximum rate of climb table. A winds aloft profile is shared by every climb
+    profile. Profiles climb different heights and so have
+    different numbers of 500 ft segments; they are evaluated together on a padded
+    (profiles, segments) grid with a mask for the segments past each profile's end.
+    With a tolerance, every profile is instead integrated on the same quadrature nodes,
+    so no padding is needed.
+
+    Returns:
+        Tuple of (max_true_airspeed, max_ground_speed, min_climb_gradient_ft_per_nm)
+        arrays, zero for profiles that do not climb
+    """
+    (
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+    ) = _profile_arrays(
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+    )
+
+    altitude_change = end_altitude - start_altitude
+    is_climb = altitude_change > 0
+
+    if tolerance is not None:
+        integrate_climb = functools.partial(_climb_quadrature, tolerance)
+    else:
+        integrate_climb = _climb_padded_segments
+    max_true_airspeed, max_ground_speed, total_distance = integrate_climb(
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_indicated_airspeed,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+
+    # Profiles that do not climb report zeros
+    max_true_airspeed = np.where(is_climb[..., 0], max_true_airspeed, 0)
+    max_ground_speed = np.where(is_climb[..., 0], max_ground_speed, 0)
+    total_distance = np.where(is_climb[..., 0], total_distance, 0)
+
+    min_climb_gradient = np.divide(
+        altitude_change[..., 0],
+        total_distance,
+        out=np.zeros_like(total_distance),
+        where=~(total_distance <= 0),
+    )
+
+    return max_true_airspeed[()], max_ground_speed[()], min_climb_gradient[()]
+
+
+def _climb_speed_factor(
+    indicated_airspeed: np.ndarray, pressure_altitude: np.ndarray
+) -> np.ndarray:
+    """
+    Fraction of the best rate of climb available when climbing at another airspeed.
+
+    Rate of climb is modelled as a parabola in indicated airspeed, peaking at the best
+    rate of climb speed (Vy) for the pressure altitude. Its width is set so that climb
+    rate divided by airspeed, the climb angle in still air, peaks at the best angle of
+    climb speed (Vx).
+    """
+    best_rate_speed = np.interp(pressure_altitude, *ip.climb_speed_roc)
+    best_angle_speed = tb.best_angle_of_climb_speed
+    width = best_rate_speed**2 - best_angle_speed**2
+    return 1 - (indicated_airspeed - best_rate_speed) ** 2 / width
+
+
+def _climb_airspeed_sweep(
+    indicated_airspeeds: np.ndarray,
+    start_altitude: float,
+    end_altitude: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate one climb at many indicated airspeeds on shared quadrature nodes.
+
+    Returns:
+        Tuple of (climb_gradients, times) arrays with one entry per airspeed, in feet
+        per nautical mile and minutes. Airspeeds that cannot climb somewhere along the
+        way have a gradient of zero and an infinite time, and both are NaN where the
+        climb leaves the rate of climb table.
+    """
+    altitude_change = end_altitude - start_altitude
+    ratio, weights = _gauss_legendre(32)
+    altitude = start_altitude + ratio * altitude_change
+    indicated_airspeeds = np.asarray(indicated_airspeeds, dtype=float)[..., np.newaxis]
+
+    # Climb rates are the rates at Vy, reduced for the airspeed flown
+    best_climb_rate, _, ground_speed = _climb_performance(
+        altitude,
+        ratio,
+        start_climb_rate,
+        end_climb_rate,
+        indicated_airspeeds,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+    pressure_altitude = get_pressure_altitude(altimeter_setting, altitude)
+    climb_rate = best_climb_rate * _climb_speed_factor(
+        indicated_airspeeds, pressure_altitude
+    )
+
+    is_climbing = np.all(climb_rate > 0, axis=-1)
+    is_known = ~np.any(np.isnan(climb_rate), axis=-1)
+    minutes_per_foot = np.divide(
+        1, climb_rate, out=np.zeros_like(climb_rate), where=climb_rate > 0
+    )
+    time = np.sum(weights * minutes_per_foot, axis=-1) * altitude_change
+    distance = np.sum(weights * minutes_per_foot * ground_speed / 60, axis=-1)
+    distance = distance * altitude_change
+
+    climb_gradient = np.divide(
+        altitude_change,
+        distance,
+        out=np.zeros_like(distance),
+        where=is_climbing & (distance > 0),
+    )
+    time = np.where(is_climbing, time, np.inf)
+
+    # Climbs leaving the rate of climb table have no known gradient or time
+    climb_gradient = np.where(is_known, climb_gradient, np.nan)
+    time = np.where(is_known, time, np.nan)
+
+    return climb_gradient, time
+
+
+def optimize_climb_airspeed(
+    start_altitude: float,
+    end_altitude: float,
+    start_climb_rate: float | None,
+    end_climb_rate: float | None,
+    start_temp: float,
+    end_temp: float,
+    start_wind_dir: float,
+    start_wind_speed: float,
+    end_wind_dir: float,
+    end_wind_speed: float,
+    start_heading: float,
+    end_heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+    objective: str = "gradient",
+    indicated_airspeeds: np.ndarray = None,
+    refinements: int = 3,
+) -> tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the indicated airspeed that gives the steepest or the quickest climb.
+
+    Every candidate airspeed is evaluated in one array computation, then the sweep is
+    repeated on a finer grid around the best candidate. Climb rates are taken as the
+    rates at the best rate of climb speed (Vy), from the arguments or from the maximum
+    rate of climb table when both are None, and reduced away from Vy so that the climb
+    angle in still air peaks at the best angle of climb speed (Vx). Headwind moves the
+    steepest climb speed down and tailwind moves it up.
+
+    Args:
+        objective: "gradient" to maximize climb gradient (obstacle and departure
+            procedure compliance) or "time" to minimize time to altitude
+        indicated_airspeeds: Candidate airspeeds in knots for the first sweep,
+            55 to 90 knots in 1 knot steps by default
+        refinements: Number of finer sweeps around the best candidate, each ten times
+            finer than the one before
+
+    The remaining arguments are as for calculate_climb_gradient.
+
+    Returns:
+        Tuple of (optimal_airspeed, indicated_airspeeds, climb_gradients, times), with
+        the gradient (ft/nm) and time (minutes) curves over the first sweep. Everything
+        but the airspeeds is NaN if the climb leaves the rate of climb table.
+    """
+    if objective not in ("gradient", "time"):
+        raise ValueError(f"Unknown climb objective {objective!r}")
+    if end_altitude <= start_altitude:
+        raise ValueError("Ending altitude must be higher than starting altitude")
+
+    if indicated_airspeeds is None:
+        indicated_airspeeds = np.arange(55, 91, 1.0)
+    indicated_airspeeds = np.sort(np.asarray(indicated_airspeeds, dtype=float))
+
+    conditions = (
+        start_altitude,
+        end_altitude,
+        start_climb_rate,
+        end_climb_rate,
+        start_temp,
+        end_temp,
+        start_wind_dir,
+        start_wind_speed,
+        end_wind_dir,
+        end_wind_speed,
+        start_heading,
+        end_heading,
+        altimeter_setting,
+        winds_aloft,
+    )
+    climb_gradients, times = _climb_airspeed_sweep(indicated_airspeeds, *conditions)
+
+    # The climb rate does not depend on the candidate, so either all or none are known
+    if np.all(np.isnan(climb_gradients)):
+        return np.nan, indicated_airspeeds, climb_gradients, times
+
+    candidates = indicated_airspeeds
+    scores = climb_gradients if objective == "gradient" else -times
+    for _ in range(refinements):
+        best = int(np.argmax(scores))
+        lower = candidates[max(best - 1, 0)]
+        upper = candidates[min(best + 1, len(candidates) - 1)]
+        candidates = np.linspace(lower, upper, 21)
+        candidate_gradients, candidate_times = _climb_airspeed_sweep(
+            candidates, *conditions
+        )
+        scores = candidate_gradients if objective == "gradient" else -candidate_times
+
+    optimal_airspeed = float(candidates[np.argmax(scores)])
+
+    return optimal_airspeed, indicated_airspeeds, climb_gradients, times
+
+
+def get_climb_gradient_compliance(
+    required_gradients: np.ndarray,
+    start_altitude: float,
+    end_altitudes: np.ndarray,
+    headings: np.ndarray,
+    indicated_airspeed: float,
+    temperatures: np.ndarray,
+    wind_directions: np.ndarray,
+    wind_speeds: np.ndarray,
+    altimeter_settings: np.ndarray,
+    start_climb_rate: float | None = None,
+    end_climb_rate: float | None = None,
+    chunk_size: int = 4096,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Check departure procedure climb gradients across a grid of weather scenarios.
+
+    Every combination of departure, temperature, wind and altimeter setting is one
+    climb profile. Profiles are evaluated with calculate_climb_gradients in chunks of
+    chunk_size, so memory stays bounded however large the grid is.
+
+    Args:
+        required_gradients: Published climb gradient of each departure in ft/nm
+        start_altitude: Departure end of runway elevation in feet MSL
+        end_altitudes: Altitude each departure's gradient applies up to in feet MSL,
+            broadcast against required_gradients
+        headings: Magnetic heading flown on each departure, broadcast against
+            required_gradients
+        indicated_airspeed: Climb speed in knots
+        temperatures: Temperatures at start_altitude in degrees Celsius, decreasing by
+            the standard 1.98 degrees per 1000 ft through the climb
+        wind_directions: Wind direction of each wind case in degrees
+        wind_speeds: Wind speed of each wind case in knots, broadcast against
+            wind_directions
+        altimeter_settings: Altimeter settings in inches Hg
+        start_climb_rate: Climb rate at start_altitude in ft/min, None (with
+            end_climb_rate) to use the maximum rate of climb table
+        end_climb_rate: Climb rate at the end altitude in ft/min
+
+    The climb data are for maximum gross weight, so lighter weights comply with at
+    least the margin found here.
+
+    With the maximum rate of climb table, scenarios whose climb leaves the table (a
+    hot day, or a climb above 12000 ft pressure altitude) are flagged in status and
+    have a NaN margin, while the rest of the grid is still evaluated.
+
+    Returns:
+        Tuple of (compliant, margin, status) arrays of shape (departures, temperatures,
+        wind cases, altimeter settings). Margin is the minimum climb gradient less the
+        required gradient in ft/nm, and compliant is where it is not negative. Status
+        is a bitwise combination of the CLIMB_* flags.
+    """
+    required_gradients, end_altitudes, headings = (
+        np.ravel(value)
+        for value in np.broadcast_arrays(required_gradients, end_altitudes, headings)
+    )
+    wind_directions, wind_speeds = (
+        np.ravel(value) for value in np.broadcast_arrays(wind_directions, wind_speeds)
+    )
+    temperatures = np.ravel(temperatures)
+    altimeter_settings = np.ravel(altimeter_settings)
+
+    shape = (
+        len(required_gradients),
+        len(temperatures),
+        len(wind_directions),
+        len(altimeter_settings),
+    )
+    margin = np.empty(shape)
+    flat_margin = margin.reshape(-1)
+    status = np.full(shape, CLIMB_OK)
+    flat_status = status.reshape(-1)
+
+    for start in range(0, margin.size, chunk_size):
+        stop = min(start + chunk_size, margin.size)
+        departure, temperature, wind, altimeter = np.unravel_index(
+            np.arange(start, stop), shape
+        )
+
+        end_altitude = end_altitudes[departure]
+        start_temp = temperatures[temperature]
+        end_temp = start_temp - 1.98 * (end_altitude - start_altitude) / 1000
+
+        if start_climb_rate is None:
+            # Temperature and pressure altitude change monotonically through the
+            # climb, so it stays in the table if both of its ends do
+            climb_ends = ((start_altitude, start_temp), (end_altitude, end_temp))
+            for altitude, temp in climb_ends:
+                pressure_altitude = get_pressure_altitude(
+                    altimeter_settings[altimeter], altitude
+                )
+                points = np.stack(
+                    np.broadcast_arrays(temp, np.maximum(pressure_altitude, 0)), axis=-1
+                )
+                _, end_status = ip.interpolate_within_envelope(
+                    ip.max_rate_of_climb, points
+                )
+                flat_status[start:stop] |= end_status
+
+        _, _, min_climb_gradient = calculate_climb_gradients(
+            start_altitude,
+            end_altitude,
+            start_climb_rate,
+            end_climb_rate,
+            indicated_airspeed,
+            start_temp,
+            end_temp,
+            wind_directions[wind],
+            wind_speeds[wind],
+            wind_directions[wind],
+            wind_speeds[wind],
+            headings[departure],
+            headings[departure],
+            altimeter_settings[altimeter],
+        )
+        flat_margin[start:stop] = min_climb_gradient - required_gradients[departure]
+
+    margin[status != CLIMB_OK] = np.nan
+
+    return margin >= 0, margin, status
+
+
+def get_time_fuel_distance_to_climb(
+    start_pressure_altitude: float,
+    end_pressure_altitude: float,
+    profile_altitudes: np.ndarray = None,
+    profile_temperatures: np.ndarray = None,
+) -> tuple[float, float, float]:
+    """
+    Compute the time, fuel and distance to climb between two pressure altitudes.
+
+    The POH table gives each quantity cumulatively from sea level (2550 lb, full
+    throttle, standard temperature, zero wind), so a climb is the difference between
+    the values interpolated at its end and start altitudes.
+
+    With a temperature profile, the POH correction for nonstandard temperature is
+    applied: time, fuel and distance increase 10% for each 10 degC above standard.
+    The deviation is taken at the middle of each 1000 ft band of the table, and each
+    band's share of the climb is scaled separately.
+
+    An end altitude below the start altitude gives the climb between them negated, with
+    or without a temperature profile.
+
+    Args:
+        start_pressure_altitude: Pressure altitude at the start of the climb in feet
+        end_pressure_altitude: Pressure altitude at the end of the climb in feet
+        profile_altitudes: Pressure altitudes of the temperature profile levels in feet,
+            ascending, shape (levels,)
+        profile_temperatures: Temperatures at the profile levels in degrees Celsius,
+            shape (levels,) shared by every climb or (..., levels) per climb. Held
+            constant beyond the highest and lowest levels. Give both profile arguments
+            or neither.
+
+    The altitude arguments may be scalars or NumPy arrays, broadcast against each other
+    and against the leading dimensions of profile_temperatures. The POH table starts at
+    sea level, so pressure altitudes below it (a low field with a high altimeter
+    setting) are taken as sea level.
+
+    Returns:
+        Tuple of (time, fuel, distance) in minutes, gallons and nautical miles
+    """
+    start_pressure_altitude = np.maximum(start_pressure_altitude, 0)
+    end_pressure_altitude = np.maximum(end_pressure_altitude, 0)
+
+    if (profile_altitudes is None) != (profile_temperatures is None):
+        raise ValueError(
+            "profile_altitudes and profile_temperatures must be given together"
+        )
+    if profile_temperatures is not None:
+        return _get_time_fuel_distance_to_climb_nonstandard(
+            start_pressure_altitude,
+            end_pressure_altitude,
+            profile_altitudes,
+            profile_temperatures,
+        )
+
+    altitudes = np.stack(
+        np.broadcast_arrays(start_pressure_altitude, end_pressure_altitude), axis=-1
+    )
+
+    # Interpolate both ends of every climb in one call, shape (..., 2, 3)
+    cumulative = ip.climb_time_fuel_distance(altitudes.reshape(-1, 1))
+    cumulative = cumulative.reshape(altitudes.shape + (3,))
+    climb = cumulative[..., 1, :] - cumulative[..., 0, :]
+    time, fuel, distance = np.moveaxis(climb, -1, 0)
+
+    return time[()], fuel[()], distance[()]
+
+
+def _get_time_fuel_distance_to_climb_nonstandard(
+    start_pressure_altitude: np.ndarray,
+    end_pressure_altitude: np.ndarray,
+    profile_altitudes: np.ndarray,
+    profile_temperatures: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute time, fuel and distance to climb with the nonstandard temperature
+    correction applied band by band; see get_time_fuel_distance_to_climb.
+    """
+    band_edges = ip.climb_time_fuel_distance.grid[0]
+    cumulative = ip.climb_time_fuel_distance.values
+    start_pressure_altitude = np.asarray(start_pressure_altitude, dtype=float)
+    end_pressure_altitude = np.asarray(end_pressure_altitude, dtype=float)
+    climb_ends = {"start": start_pressure_altitude, "end": end_pressure_altitude}
+    for name, altitude in climb_ends.items():
+        if np.any(altitude > band_edges[-1]):
+            raise ValueError(
+                f"Climb {name} pressure altitude is above the {band_edges[-1]:.0f} ft "
+                "top of the time, fuel and distance to climb table"
+            )
+
+    # Feet of each climb inside each band, shape (..., bands). A descent counts the
+    # bands it passes through negatively, as the difference of cumulative values does.
+    band_bottom, band_top = band_edges[:-1], band_edges[1:]
+    lower_altitude = np.minimum(start_pressure_altitude, end_pressure_altitude)
+    upper_altitude = np.maximum(start_pressure_altitude, end_pressure_altitude)
+    overlap_bottom = np.maximum(lower_altitude[..., np.newaxis], band_bottom)
+    overlap_top = np.minimum(upper_altitude[..., np.newaxis], band_top)
+    direction = np.where(end_pressure_altitude < start_pressure_altitude, -1, 1)
+    overlap = np.maximum(overlap_top - overlap_bottom, 0) * direction[..., np.newaxis]
+
+    # Profile temperature at each band middle, as a (bands, levels) weight matrix
+    band_middle = (band_bottom + band_top) / 2
+    level_weights = np.stack(
+        [
+            np.interp(band_middle, profile_altitudes, level)
+            for level in np.eye(len(profile_altitudes))
+        ],
+        axis=-1,
+    )
+    band_temperature = np.asarray(profile_temperatures, dtype=float) @ level_weights.T
+
+    standard_temperature = np.interp(
+        band_middle,
+        tb.pressure_altitude_timefueldist_index,
+        tb.temperature_timefueldist_index,
+    )
+    isa_deviation = np.maximum(band_temperature - standard_temperature, 0)
+    band_modifier = 1 + 0.1 * isa_deviation / 10
+
+    # The table is linear inside each band, so each band adds slope x overlap
+    band_slope = np.diff(cumulative, axis=0) / np.diff(band_edges)[:, np.newaxis]
+    climb = np.einsum("...b,bq->...q", overlap * band_modifier, band_slope)
+    time, fuel, distance = np.moveaxis(climb, -1, 0)
+
+    return time[()], fuel[()], distance[()]
+
+
+def calculate_cruise_performance(
+    altitude: float,
+    temperature: float,
+    rpm: float,
     altimeter_setting: float,
     manifold_pressure: float = None,
     user_performance_data: dict = None
@@ -451,6 +1983,44 @@ def interpolate_cruise_data(
         return interpolate_cruise_data_no_mp(pressure_altitude, temperature, rpm)
 
 
+def get_cruise_performance_with_mp(
+    pressure_altitude: np.ndarray,
+    temperature: np.ndarray,
+    manifold_pressure: np.ndarray,
+    rpm: np.ndarray,
+    extrapolation: str = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Interpolate cruise performance with manifold pressure for many points at once.
+
+    True airspeed and fuel flow are interpolated multilinearly over pressure altitude,
+    temperature, manifold pressure and RPM in one lookup. Points outside the cruise
+    tables are flagged in a status array instead of raising ValueError.
+
+    Args:
+        pressure_altitude: Pressure altitudes in feet
+        temperature: Temperatures in degrees Celsius
+        manifold_pressure: Manifold pressures in inches Hg
+        rpm: Engine RPMs
+        extrapolation: Policy for out of range points, as for
+            get_takeoff_distances_sfto_checked
+
+    Returns:
+        Tuple of (true_airspeed, fuel_flow, status) arrays with the broadcast shape, or
+        scalars for scalar input, in knots and gallons per hour. Status is CRUISE_OK or
+        a combination of the CRUISE_*_OUT_OF_RANGE flags.
+    """
+    points = np.stack(
+        np.broadcast_arrays(pressure_altitude, temperature, manifold_pressure, rpm),
+        axis=-1,
+    )
+    performance, status = ip.interpolate_within_envelope(
+        ip.cruise_performance, points, extrapolation
+    )
+
+    return performance[..., 0][()], performance[..., 1][()], status[()]
+
+
 def interpolate_cruise_data_with_mp(
     pressure_altitude: float,
     temperature: float,
@@ -459,6 +2029,8 @@ def interpolate_cruise_data_with_mp(
 ) -> tuple[float, float]:
     """
     Interpolate cruise performance data with manifold pressure from built-in tables.
+
+    Conditions outside the tables are held at the nearest table edge.
     
     Args:
         pressure_altitude: Pressure altitude in feet
@@ -469,61 +2041,56 @@ def interpolate_cruise_data_with_mp(
     Returns:
         Tuple of (true_airspeed, fuel_flow) in knots and gallons per hour
     """
-    # For simplicity, use 4D linear interpolation
-    # In a real implementation, you'd use scipy.interpolate.RegularGridInterpolator
-    
-    # Find the bounding values for interpolation
-    alt_indices = np.searchsorted(tb.cruise_pressure_altitudes, pressure_altitude)
-    temp_indices = np.searchsorted(tb.cruise_temperatures, temperature)
-    mp_indices = np.searchsorted(tb.cruise_manifold_pressures, manifold_pressure)
-    rpm_indices = np.searchsorted(tb.cruise_rpms, rpm)
-    
-    # Handle edge cases
-    alt_indices = np.clip(alt_indices, 1, len(tb.cruise_pressure_altitudes) - 1)
-    temp_indices = np.clip(temp_indices, 1, len(tb.cruise_temperatures) - 1)
-    mp_indices = np.clip(mp_indices, 1, len(tb.cruise_manifold_pressures) - 1)
-    rpm_indices = np.clip(rpm_indices, 1, len(tb.cruise_rpms) - 1)
-    
-    # For simplified implementation, use nearest neighbor
-    # In production, implement proper 4D interpolation
-    alt_idx = min(alt_indices, len(tb.cruise_pressure_altitudes) - 1)
-    temp_idx = min(temp_indices, len(tb.cruise_temperatures) - 1)
-    mp_idx = min(mp_indices, len(tb.cruise_manifold_pressures) - 1)
-    rpm_idx = min(rpm_indices, len(tb.cruise_rpms) - 1)
-    
-    # Handle case where we're exactly at table values
-    if alt_idx == 0:
-        alt_idx = 0
-    else:
-        alt_idx = alt_idx - 1
-        
-    if temp_idx == 0:
-        temp_idx = 0
-    else:
-        temp_idx = temp_idx - 1
-        
-    if mp_idx == 0:
-        mp_idx = 0
-    else:
-        mp_idx = mp_idx - 1
-        
-    if rpm_idx == 0:
-        rpm_idx = 0
-    else:
-        rpm_idx = rpm_idx - 1
-    
-    # Extract values from tables
-    try:
-        true_airspeed = tb.cruise_true_airspeed[alt_idx][temp_idx][mp_idx][rpm_idx]
-        fuel_flow = tb.cruise_fuel_flow[alt_idx][temp_idx][mp_idx][rpm_idx]
-    except IndexError:
-        # Fallback if indices are out of bounds
-        true_airspeed = 120.0  # Default reasonable value
-        fuel_flow = 8.5  # Default reasonable value
+    true_airspeed, fuel_flow, _ = get_cruise_performance_with_mp(
+        pressure_altitude, temperature, manifold_pressure, rpm, extrapolation="clamp"
+    )
     
     return float(true_airspeed), float(fuel_flow)
 
 
+def get_cruise_performance_no_mp(
+    pressure_altitude: np.ndarray,
+    temperature: np.ndarray,
+    rpm: np.ndarray,
+    extrapolation: str = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Interpolate cruise performance without manifold pressure for many points at once.
+
+    True airspeed and fuel flow are interpolated trilinearly over pressure altitude,
+    temperature and RPM in one lookup. Points outside the cruise tables are flagged in
+    a status array instead of falling back to fixed values.
+
+    Args:
+        pressure_altitude: Pressure altitudes in feet
+        temperature: Temperatures in degrees Celsius
+        rpm: Engine RPMs
+        extrapolation: Policy for out of range points, as for
+            get_takeoff_distances_sfto_checked
+
+    Returns:
+        Tuple of (true_airspeed, fuel_flow, status) arrays with the broadcast shape, or
+        scalars for scalar input, in knots and gallons per hour. Status is CRUISE_OK or
+        a combination of CRUISE_PRESSURE_ALTITUDE_OUT_OF_RANGE,
+        CRUISE_TEMPERATURE_OUT_OF_RANGE and CRUISE_RPM_OUT_OF_RANGE.
+    """
+    points = np.stack(np.broadcast_arrays(pressure_altitude, temperature, rpm), axis=-1)
+    performance, status = ip.interpolate_within_envelope(
+        ip.cruise_performance_no_mp, points, extrapolation
+    )
+
+    # RPM is the third axis of this table rather than the fourth, so move its flag to
+    # CRUISE_RPM_OUT_OF_RANGE. The first two axes already match their flags.
+    rpm_axis = 2
+    is_rpm_out_of_range = (status & (1 << rpm_axis)) != 0
+    status = (
+        status
+        & (CRUISE_PRESSURE_ALTITUDE_OUT_OF_RANGE | CRUISE_TEMPERATURE_OUT_OF_RANGE)
+    ) | np.where(is_rpm_out_of_range, CRUISE_RPM_OUT_OF_RANGE, CRUISE_OK)
+
+    return performance[..., 0][()], performance[..., 1][()], status[()]
+
+
 def interpolate_cruise_data_no_mp(
     pressure_altitude: float,
     temperature: float,
@@ -531,6 +2098,8 @@ def interpolate_cruise_data_no_mp(
 ) -> tuple[float, float]:
     """
     Interpolate cruise performance data without manifold pressure from built-in tables.
+
+    Conditions outside the tables are held at the nearest table edge.
     
     Args:
         pressure_altitude: Pressure altitude in feet
@@ -540,46 +2109,9 @@ def interpolate_cruise_data_no_mp(
     Returns:
         Tuple of (true_airspeed, fuel_flow) in knots and gallons per hour
     """
-    # Find the bounding values for interpolation
-    alt_indices = np.searchsorted(tb.cruise_pressure_altitudes, pressure_altitude)
-    temp_indices = np.searchsorted(tb.cruise_temperatures, temperature)
-    rpm_indices = np.searchsorted(tb.cruise_rpms, rpm)
-    
-    # Handle edge cases
-    alt_indices = np.clip(alt_indices, 1, len(tb.cruise_pressure_altitudes) - 1)
-    temp_indices = np.clip(temp_indices, 1, len(tb.cruise_temperatures) - 1)
-    rpm_indices = np.clip(rpm_indices, 1, len(tb.cruise_rpms) - 1)
-    
-    # For simplified implementation, use nearest neighbor
-    # In production, implement proper 3D interpolation
-    alt_idx = min(alt_indices, len(tb.cruise_pressure_altitudes) - 1)
-    temp_idx = min(temp_indices, len(tb.cruise_temperatures) - 1)
-    rpm_idx = min(rpm_indices, len(tb.cruise_rpms) - 1)
-    
-    # Handle case where we're exactly at table values
-    if alt_idx == 0:
-        alt_idx = 0
-    else:
-        alt_idx = alt_idx - 1
-        
-    if temp_idx == 0:
-        temp_idx = 0
-    else:
-        temp_idx = temp_idx - 1
-        
-    if rpm_idx == 0:
-        rpm_idx = 0
-    else:
-        rpm_idx = rpm_idx - 1
-    
-    # Extract values from tables
-    try:
-        true_airspeed = tb.cruise_true_airspeed_no_mp[alt_idx][temp_idx][rpm_idx]
-        fuel_flow = tb.cruise_fuel_flow_no_mp[alt_idx][temp_idx][rpm_idx]
-    except IndexError:
-        # Fallback if indices are out of bounds
-        true_airspeed = 120.0  # Default reasonable value
-        fuel_flow = 8.5  # Default reasonable value
+    true_airspeed, fuel_flow, _ = get_cruise_performance_no_mp(
+        pressure_altitude, temperature, rpm, extrapolation="clamp"
+    )
     
     return float(true_airspeed), float(fuel_flow)
 
@@ -593,6 +2125,11 @@ def interpolate_user_cruise_data(
 ) -> tuple[float, float]:
     """
     Interpolate cruise performance from user-provided data.
+
+    With a compiled POH cruise chart under "cruise_table" (see
+    user_tables_172S.load_user_cruise_table) the chart is interpolated, holding
+    conditions outside it at the nearest table edge. Otherwise a single reference
+    point is scaled by the conditions.
     
     Args:
         user_data: Dictionary containing user performance data
@@ -604,8 +2141,18 @@ def interpolate_user_cruise_data(
     Returns:
         Tuple of (true_airspeed, fuel_flow) in knots and gallons per hour
     """
-    # For now, return a simple calculation based on user data
-    # In a full implementation, this would do proper interpolation
+    cruise_table = user_data.get("cruise_table")
+    if cruise_table is not None:
+        true_airspeed, fuel_flow, _ = cruise_table(
+            pressure_altitude,
+            temperature,
+            rpm,
+            manifold_pressure,
+            extrapolation="clamp",
+        )
+        return float(true_airspeed), float(fuel_flow)
+
+    # Without a chart, scale the reference point by the conditions
     
     # Default values if user data is incomplete
     base_tas = user_data.get('base_tas', 120.0)
@@ -628,6 +2175,124 @@ def interpolate_user_cruise_data(
     return adjusted_tas, adjusted_fuel_flow
 
 
+# Fields of the options returned by optimize_cruise
+CRUISE_OPTION_DTYPE = np.dtype(
+    [
+        ("altitude", float),  # feet MSL
+        ("rpm", float),
+        ("manifold_pressure", float),  # inches Hg, NaN without manifold pressure
+        ("true_airspeed", float),  # knots
+        ("ground_speed", float),  # knots
+        ("fuel_flow", float),  # gallons per hour
+        ("time", float),  # hours for the leg
+        ("fuel", float),  # gallons for the leg
+        ("fuel_per_nm", float),  # gallons per nautical mile
+        ("status", np.int64),  # CRUISE_* flags
+    ]
+)
+
+
+def optimize_cruise(
+    distance: float,
+    heading: float,
+    altimeter_setting: float,
+    winds_aloft: np.ndarray = None,
+    objective: str = "fuel",
+    altitudes: np.ndarray = None,
+    rpms: np.ndarray = None,
+    manifold_pressures: np.ndarray = None,
+    extrapolation: str = "clamp",
+) -> np.ndarray:
+    """
+    Rank every combination of cruise altitude and power setting for one leg.
+
+    The whole (altitude, manifold pressure, RPM) candidate grid is evaluated in one
+    array computation. Temperature and wind at each altitude come from the winds
+    aloft profile, or from the standard atmosphere in calm air when none is given.
+
+    Args:
+        distance: Leg distance in nautical miles
+        heading: Magnetic heading flown in degrees
+        altimeter_setting: Altimeter setting in inches Hg
+        winds_aloft: Profile array as for interpolate_winds_aloft
+        objective: "fuel" to minimize fuel per nautical mile, which also maximizes
+            range on a given fuel load, or "time" to minimize time for the leg
+        altitudes: Candidate cruise altitudes in feet MSL, 2000-12000 ft in 500 ft
+            steps by default
+        rpms: Candidate RPMs, 2200-2500 in 50 RPM steps by default
+        manifold_pressures: Candidate manifold pressures in inches Hg, or None to use
+            the tables without manifold pressure
+        extrapolation: Policy for candidates outside the cruise tables, as for
+            get_takeoff_distances_sfto_checked. Candidates left as NaN are dropped.
+
+    Returns:
+        Structured array of CRUISE_OPTION_DTYPE, best option first
+    """
+    if objective not in ("fuel", "time"):
+        raise ValueError(f"Unknown cruise objective {objective!r}")
+
+    if altitudes is None:
+        altitudes = np.arange(2000, 12001, 500)
+    if rpms is None:
+        rpms = np.arange(2200, 2501, 50)
+    altitudes = np.ravel(altitudes).astype(float)
+    rpms = np.ravel(rpms).astype(float)
+
+    if winds_aloft is not None:
+        wind_dir, wind_speed, temperature = interpolate_winds_aloft(
+            winds_aloft, altitudes
+        )
+    else:
+        wind_dir = wind_speed = np.zeros_like(altitudes)
+        temperature = 15 - 1.98 * altitudes / 1000
+    pressure_altitude = get_pressure_altitude(altimeter_setting, altitudes)
+
+    # Candidate grid of (altitude, manifold pressure, RPM)
+    if manifold_pressures is not None:
+        manifold_pressures = np.ravel(manifold_pressures).astype(float)
+        true_airspeed, fuel_flow, status = get_cruise_performance_with_mp(
+            pressure_altitude[:, np.newaxis, np.newaxis],
+            temperature[:, np.newaxis, np.newaxis],
+            manifold_pressures[:, np.newaxis],
+            rpms,
+            extrapolation,
+        )
+    else:
+        manifold_pressures = np.array([np.nan])
+        true_airspeed, fuel_flow, status = get_cruise_performance_no_mp(
+            pressure_altitude[:, np.newaxis, np.newaxis],
+            temperature[:, np.newaxis, np.newaxis],
+            rpms[np.newaxis, np.newaxis, :],
+            extrapolation,
+        )
+    ground_speed = get_ground_speed(
+        true_airspeed,
+        heading,
+        wind_dir[:, np.newaxis, np.newaxis],
+        wind_speed[:, np.newaxis, np.newaxis],
+    )
+
+    options = np.empty(true_airspeed.shape, dtype=CRUISE_OPTION_DTYPE)
+    options["altitude"] = altitudes[:, np.newaxis, np.newaxis]
+    options["manifold_pressure"] = manifold_pressures[:, np.newaxis]
+    options["rpm"] = rpms
+    options["true_airspeed"] = true_airspeed
+    options["ground_speed"] = ground_speed
+    options["fuel_flow"] = fuel_flow
+    options["status"] = status
+
+    # Legs the aircraft cannot make good against the wind take forever
+    with np.errstate(divide="ignore"):
+        options["time"] = np.where(ground_speed > 0, distance / ground_speed, np.inf)
+    options["fuel"] = options["time"] * fuel_flow
+    options["fuel_per_nm"] = options["fuel"] / distance
+
+    options = options[~np.isnan(true_airspeed)]
+    order = np.argsort(options["fuel_per_nm" if objective == "fuel" else "time"])
+
+    return options[order]
+
+
 def calculate_endurance(
     total_fuel: float,
     reserve_fuel: float,
@@ -70,10 +70,13 @@ sfto_dist_50_feet = np.array(
 )
 
 # maximum rate of climb data at max gross weight
-pressure_altitude_roc_index = np.arange(0, 12000, 2000)
-temperature_roc_index = np.arange(-20, 40, 20)
+pressure_altitude_roc_index = np.arange(0, 14000, 2000)
+temperature_roc_index = np.arange(-20, 60, 20)
 climb_speed_roc_index = np.array([74, 73, 73, 73, 72, 72, 72])
+# Best angle of climb speed (KIAS) at max gross weight
+best_angle_of_climb_speed = 62
 
+# Rate of climb (ft/min) - [temperature][pressure_altitude]
 max_rate_of_climb = np.array(
     [
         [855, 760, 685, 575, 465, 360, 255],
@@ -84,8 +87,9 @@ max_rate_of_climb = np.array(
 )
 
 # time fuel and distance to climb at max gross weight
-pressure_altitude_timefueldist_index = np.arange(0, 12000, 1000)
-temperature_timefueldist_index = np.arange(15, -9, 2)
+pressure_altitude_timefueldist_index = np.arange(0, 13000, 1000)
+# Standard temperature at each pressure altitude, 15 degC at sea level down to -9 degC
+temperature_timefueldist_index = np.arange(15, -10, -2)
 climb_speed_timefueldist_index = np.array(
     [74, 73, 73, 73, 73, 73, 73, 73, 72, 72, 72, 72, 72]
 )
@@ -0,0 +1,182 @@
+# Imports
+import csv
+import hashlib
+import io
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+import interpolators_172S as ip
+
+# Columns of a user cruise table. Manifold pressure is optional, for aircraft whose
+# cruise chart is by RPM only.
+cruise_axis_columns = ("pressure_altitude", "temperature", "manifold_pressure", "rpm")
+cruise_value_columns = ("true_airspeed", "fuel_flow")
+
+# Number of compiled tables kept for reuse, as a session typically switches between
+# only a few uploaded charts
+cruise_table_cache_size = 8
+
+# Compiled tables by (SHA-256 hash of the uploaded file, file format), least recently
+# used first
+_compiled_cruise_tables = OrderedDict()
+
+
+class UserCruiseTable:
+    """
+    Cruise chart from the pilot's operating handbook, compiled into a grid interpolator.
+
+    True airspeed and fuel flow are stacked as two channels over the table's axes, in
+    the order of cruise_axis_columns. Axes with a single value in the chart (for
+    example a chart for standard temperature only) are dropped, and that condition is
+    ignored when the table is interpolated.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        self.axis_names = tuple(
+            name
+            for name in cruise_axis_columns
+            if name in columns and len(np.unique(columns[name])) > 1
+        )
+        if not self.axis_names:
+            raise ValueError("Cruise table must vary at least one condition")
+
+        axes = [np.unique(columns[name]) for name in self.axis_names]
+        indices = tuple(
+            np.searchsorted(axis, columns[name])
+            for axis, name in zip(axes, self.axis_names)
+        )
+
+        shape = tuple(len(axis) for axis in axes)
+        counts = np.zeros(shape, dtype=int)
+        np.add.at(counts, indices, 1)
+        if np.any(counts > 1):
+            raise ValueError("Cruise table has more than one row for some conditions")
+        if np.any(counts == 0):
+            raise ValueError(
+                "Cruise table must have a row for every combination of "
+                + ", ".join(self.axis_names)
+            )
+
+        values = np.empty(shape + (len(cruise_value_columns),))
+        for channel, name in enumerate(cruise_value_columns):
+            values[indices + (channel,)] = columns[name]
+
+        self.interpolator = ip.build_grid_interpolator(tuple(axes), values)
+        self.has_manifold_pressure = "manifold_pressure" in self.axis_names
+
+    def __call__(
+        self,
+        pressure_altitude: np.ndarray,
+        temperature: np.ndarray,
+        rpm: np.ndarray,
+        manifold_pressure: np.ndarray = None,
+        extrapolation: str = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interpolate the table for many points at once.
+
+        Args:
+            extrapolation: Policy for out of range points, as for
+                ip.interpolate_within_envelope
+
+        Returns:
+            Tuple of (true_airspeed, fuel_flow, status) arrays with the broadcast shape,
+            or scalars for scalar input. Status has bit d set where the condition on axis d of axis_names is outside
+            the table.
+        """
+        if self.has_manifold_pressure and manifold_pressure is None:
+            raise ValueError("This cruise table needs a manifold pressure")
+
+        conditions = {
+            "pressure_altitude": pressure_altitude,
+            "temperature": temperature,
+            "manifold_pressure": manifold_pressure,
+            "rpm": rpm,
+        }
+        points = np.stack(
+            np.broadcast_arrays(*(conditions[name] for name in self.axis_names)),
+            axis=-1,
+        )
+        performance, status = ip.interpolate_within_envelope(
+            self.interpolator, points, extrapolation
+        )
+
+        return performance[..., 0][()], performance[..., 1][()], status[()]
+
+
+def parse_cruise_table(content: bytes, file_format: str) -> dict[str, np.ndarray]:
+    """
+    Read the rows of a cruise table from a CSV or JSON file.
+
+    CSV files need a header row naming the columns. JSON files hold a list of row
+    objects, or an object with that list under "rows". Column names are those in
+    cruise_axis_columns and cruise_value_columns; manifold_pressure may be left out.
+
+    Returns:
+        Dictionary of column name to float array, one entry per row
+    """
+    text = content.decode("utf-8-sig")
+    if file_format == "csv":
+        rows = list(csv.DictReader(io.StringIO(text)))
+    elif file_format == "json":
+        rows = json.loads(text)
+        if isinstance(rows, dict):
+            rows = rows.get("rows")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON cruise table must be a list of row objects")
+    else:
+        raise ValueError(f"Unknown cruise table format {file_format!r}")
+
+    if not rows:
+        raise ValueError("Cruise table has no rows")
+
+    rows = [
+        {str(name).strip().lower(): value for name, value in row.items()}
+        for row in rows
+    ]
+    names = [
+        name
+        for name in cruise_axis_columns + cruise_value_columns
+        if name != "manifold_pressure" or name in rows[0]
+    ]
+
+    columns = {}
+    for name in names:
+        try:
+            column = np.array([float(row[name]) for row in rows])
+        except KeyError:
+            raise ValueError(f"Cruise table is missing the {name} column") from None
+        except (TypeError, ValueError):
+            raise ValueError(f"Cruise table has a non-numeric {name} value") from None
+        if not np.all(np.isfinite(column)):
+            raise ValueError(f"Cruise table has a non-finite {name} value")
+        columns[name] = column
+
+    return columns
+
+
+def load_user_cruise_table(content: bytes, file_format: str) -> UserCruiseTable:
+    """
+    Parse, check and compile a cruise table, reusing the compiled table for a file
+    that has been loaded recently.
+
+    Args:
+        content: Raw bytes of the uploaded file
+        file_format: "csv" or "json"
+
+    Returns:
+        Compiled table, cached by the SHA-256 hash of content and file_format for the
+        last cruise_table_cache_size files
+    """
+    key = (hashlib.sha256(content).hexdigest(), file_format)
+    if key in _compiled_cruise_tables:
+        _compiled_cruise_tables.move_to_end(key)
+    else:
+        columns = parse_cruise_table(content, file_format)
+        _compiled_cruise_tables[key] = UserCruiseTable(columns)
+        if len(_compiled_cruise_tables) > cruise_table_cache_size:
+            _compiled_cruise_tables.popitem(last=False)
+
+    return _compiled_cruise_tables[key]